@@ -7,24 +7,390 @@ uses ChatGPT API to generate RDF/Turtle triples following the Antigone ontology,
 and saves the output files in the correct location structure.
 """
 
+import asyncio
+import functools
+import hashlib
+import io
+import json
 import os
 import re
 import sys
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Set, Iterator
+import httpx
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, BadRequestError, InternalServerError, RateLimitError
 from rdflib import Graph, Namespace
 from rdflib.namespace import RDF
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 # Load environment variables from project directory (override so .env takes precedence over system env)
 load_dotenv(Path(__file__).parent / '.env', override=True)
 
+# System message sent with every request
+SYSTEM_PROMPT = "You are an expert annotator of Ancient Greek tragedies and an ontology-aware triple extractor."
+
+# Default location of the exact-response cache (see ResponseCache)
+LLM_CACHE_DIR = Path('.cache/llm')
+
+# Replaces the single passage when several verse ranges are packed into one request
+# (see call_chatgpt_api_multi)
+MULTI_PASSAGE_INSTRUCTIONS = (
+    "Several passages follow, each in its own <PASSAGE id=\"...\"> element. Annotate every passage "
+    "independently, following all of the rules above, and output the triples of each passage as a "
+    "complete RDF/Turtle document (with its own @prefix declarations) inside an "
+    "<OUTPUT id=\"...\"></OUTPUT> element carrying the same id. Output nothing outside the OUTPUT elements.\n\n"
+)
+_OUTPUT_BLOCK_RE = re.compile(r'<OUTPUT id="([^"]+)">(.*?)</OUTPUT>', re.DOTALL)
+# Textual canonical/translation merge (see _merge_textual): statements run from a
+# subject at column 0 to the first line ending in '.'; Line statements are recognised
+# by their type, and their single-line :text literals are dropped
+_TTL_STATEMENT_RE = re.compile(r'^[^\s#@].*?\.[ \t]*$', re.MULTILINE | re.DOTALL)
+_LINE_TYPE_RE = re.compile(r'(?:\ba|rdf:type)\s+(?:[^;.]*?[\s,])?:Line\b')
+_LINE_TEXT_RE = re.compile(
+    r'[ \t]*:text[ \t]+(?:"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+    r'(?:\^\^(?:<[^>\n]*>|[\w-]*:[\w-]*)|@[A-Za-z][\w-]*)?[ \t]*(?:;[ \t]*\n?)?'
+)
+_DANGLING_SEMICOLON_RE = re.compile(r'[ \t]*;\s*\n[ \t]*\.[ \t]*$', re.MULTILINE)
+_PREFIX_LINE_RE = re.compile(r'^@prefix\s+[\w-]*:\s*<[^>]*>\s*\.[ \t]*\n?', re.MULTILINE)
+_ANTIGONE_DEFAULT_PREFIX_RE = re.compile(r'^@prefix\s+:\s*<http://example\.org/antigone#>\s*\.', re.MULTILINE)
+
+# Leading characters of a prompt (always template text) hashed into its prompt_cache_key
+PROMPT_CACHE_KEY_CHARS = 1024
+# Placeholder in the prompt templates where the verse passage is inserted
+PASSAGE_PLACEHOLDER = '{{ INSERT PASSAGE HERE }}'
+
+# Verse range directory names, e.g. verse_773_to_805
+_VERSE_RE = re.compile(r'verse_(\d+)_to_(\d+)$')
+# Markdown code fence around the model output, with or without a language tag
+_FENCE_RE = re.compile(r'```(?:turtle|ttl)?[^\n]*\n(.*?)\n\s*```', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_text_file(path: str) -> str:
+    """Read a context file (template, ontology, demo) once per process, however many processors load it."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _token_encoding(model: str):
+    """tiktoken encoding for a model, or None if tiktoken is not installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Models newer than the installed tiktoken release
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encoding files are downloaded on first use, which fails without network access
+        print(f"  (tiktoken unavailable for {model}: {e}; estimating tokens from prompt length)", file=sys.stderr)
+        return None
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count prompt tokens with tiktoken when available, else estimate ~4 characters per token."""
+    encoding = _token_encoding(model)
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@functools.lru_cache(maxsize=None)
+def _system_prompt_tokens(model: str) -> int:
+    """Token count of SYSTEM_PROMPT, which is the same for every request."""
+    return _count_tokens(SYSTEM_PROMPT, model)
+
+
+@functools.lru_cache(maxsize=None)
+def _max_tokens_param(model: str) -> str:
+    """Name of the response length parameter: GPT-5.x models use max_completion_tokens, older models max_tokens."""
+    return "max_completion_tokens" if model.startswith("gpt-5") else "max_tokens"
+
+
+@dataclass(frozen=True, slots=True)
+class VerseRange:
+    """A verse range directory, with its verse numbers parsed once from the name."""
+    name: str   # Directory name, e.g. 'verse_773_to_805'
+    start: str  # First verse, as written in the input file names
+    end: str    # Last verse
+    dir: Path   # Path to the verse range directory
+    
+    def __str__(self) -> str:
+        return self.name
+
+
+class _FenceStripper:
+    """
+    Strip a markdown code fence from a streamed response as it arrives.
+    
+    Skips an opening ```turtle (or ``` / ```ttl) line and drops everything from
+    the closing ```, holding back at most a couple of characters between chunks.
+    Responses that do not start with a fence are passed through unchanged.
+    """
+    
+    def __init__(self):
+        # start -> header -> body -> done, or start -> plain
+        self._state = 'start'
+        self._buf = ''
+    
+    def feed(self, text: str) -> str:
+        """Consume a chunk and return the part of it that belongs to the triples."""
+        self._buf += text
+        out = []
+        while True:
+            if self._state == 'start':
+                stripped = self._buf.lstrip()
+                if len(stripped) < 3:
+                    break
+                if stripped.startswith('```'):
+                    self._state = 'header'
+                    self._buf = stripped[3:]
+                else:
+                    self._state = 'plain'
+            elif self._state == 'header':
+                newline = self._buf.find('\n')
+                if newline < 0:
+                    self._buf = ''
+                    break
+                self._buf = self._buf[newline + 1:]
+                self._state = 'body'
+            elif self._state == 'body':
+                end = self._buf.find('```')
+                if end >= 0:
+                    out.append(self._buf[:end])
+                    self._buf = ''
+                    self._state = 'done'
+                    break
+                # Hold back trailing backticks that may start the closing fence
+                keep = len(self._buf) - len(self._buf.rstrip('`'))
+                out.append(self._buf[:len(self._buf) - keep])
+                self._buf = self._buf[len(self._buf) - keep:]
+                break
+            else:
+                if self._state == 'plain':
+                    out.append(self._buf)
+                self._buf = ''
+                break
+        return ''.join(out)
+    
+    def finish(self) -> str:
+        """Return whatever is still held back once the stream has ended."""
+        rest = self._buf if self._state in ('start', 'body', 'plain') else ''
+        self._buf = ''
+        return rest
+
+
+# Default location of the semantic cache (see SemanticCache)
+SEMANTIC_CACHE_DIR = Path('.triple_cache')
+
+
+class SemanticCache:
+    """
+    On-disk cache of generated triples keyed by an embedding of the input passage.
+    
+    A lookup returns the triples stored for the most similar earlier passage in the same
+    scope (model + pipeline stage) when their cosine similarity reaches the threshold.
+    Entries are stored as {cache_dir}/{scope hash}/{passage hash}/ with embedding.npy,
+    triples.ttl and meta.json.
+    """
+    
+    def __init__(self, client: AsyncOpenAI, cache_dir: Path = SEMANTIC_CACHE_DIR, threshold: float = 0.95, embedding_model: str = "text-embedding-3-small"):
+        """
+        Initialize the cache.
+        
+        Args:
+            client: OpenAI client used to embed passages
+            cache_dir: Directory holding the cache entries
+            threshold: Minimum cosine similarity for a hit
+            embedding_model: OpenAI embedding model
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required for the semantic cache. Install with: pip install numpy")
+        self._np = np
+        self.client = client
+        self.cache_dir = Path(cache_dir)
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        # scope -> (entry directories, matrix of unit-length embeddings, one row per entry)
+        self._index: Dict[str, Tuple[List[Path], object]] = {}
+    
+    def _scope_dir(self, scope: str) -> Path:
+        return self.cache_dir / hashlib.sha256(scope.encode('utf-8')).hexdigest()[:16]
+    
+    def _load_scope(self, scope: str) -> Tuple[List[Path], object]:
+        """Load the embeddings of a scope from disk (once per run)."""
+        if scope not in self._index:
+            entries, vectors = [], []
+            scope_dir = self._scope_dir(scope)
+            if scope_dir.is_dir():
+                with os.scandir(scope_dir) as listing:
+                    names = sorted(e.name for e in listing if e.is_dir())
+                for name in names:
+                    entry_dir = scope_dir / name
+                    embedding_file = entry_dir / 'embedding.npy'
+                    if embedding_file.exists() and (entry_dir / 'triples.ttl').exists():
+                        entries.append(entry_dir)
+                        vectors.append(self._np.load(embedding_file))
+            matrix = self._np.vstack(vectors) if vectors else None
+            self._index[scope] = (entries, matrix)
+        return self._index[scope]
+    
+    async def embed(self, passage: str):
+        """Embed a passage and normalize it to unit length (so cosine similarity is a dot product)."""
+        response = await self.client.embeddings.create(model=self.embedding_model, input=passage)
+        vector = self._np.asarray(response.data[0].embedding, dtype=self._np.float32)
+        return vector / self._np.linalg.norm(vector)
+    
+    def lookup(self, scope: str, embedding) -> Optional[Tuple[str, float]]:
+        """
+        Find the cached triples of the most similar passage in a scope.
+        
+        Returns:
+            Tuple of (triples, similarity), or None if no entry reaches the threshold
+        """
+        entries, matrix = self._load_scope(scope)
+        if matrix is None:
+            return None
+        similarities = matrix @ embedding
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        triples = (entries[best] / 'triples.ttl').read_text(encoding='utf-8')
+        return triples, float(similarities[best])
+    
+    def store(self, scope: str, passage: str, embedding, triples: str):
+        """Persist the triples generated for a passage."""
+        entry_dir = self._scope_dir(scope) / hashlib.sha256(passage.encode('utf-8')).hexdigest()[:16]
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        self._np.save(entry_dir / 'embedding.npy', embedding)
+        (entry_dir / 'triples.ttl').write_text(triples, encoding='utf-8')
+        meta = {"scope": scope, "embedding_model": self.embedding_model, "passage": passage}
+        (entry_dir / 'meta.json').write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding='utf-8')
+        
+        entries, matrix = self._load_scope(scope)
+        if entry_dir in entries:
+            matrix[entries.index(entry_dir)] = embedding
+        else:
+            entries.append(entry_dir)
+            matrix = embedding[None, :] if matrix is None else self._np.vstack([matrix, embedding])
+        self._index[scope] = (entries, matrix)
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache of raw API responses.
+    
+    Each response is stored as <cache_dir>/<sha256 of the request>.txt and written
+    atomically, so concurrent or interrupted runs never leave a partial entry. The most
+    recently used entries are also kept in memory for repeated lookups within a run.
+    """
+    
+    def __init__(self, cache_dir: Path = LLM_CACHE_DIR, memory_size: int = 256):
+        """
+        Args:
+            cache_dir: Directory holding one file per cached response
+            memory_size: Number of entries kept in memory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+    
+    @staticmethod
+    def key(payload: Dict) -> str:
+        """Hash a request payload (everything that determines the response)."""
+        return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    def _remember(self, key: str, content: str):
+        self._memory[key] = content
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        try:
+            content = (self.cache_dir / f'{key}.txt').read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+        self._remember(key, content)
+        return content
+    
+    def put(self, key: str, content: str):
+        """Store a response, replacing the entry atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+            f.write(content)
+        os.replace(f.name, self.cache_dir / f'{key}.txt')
+        self._remember(key, content)
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket over both requests per minute and tokens per minute.
+    
+    Follows the openai-cookbook api_request_parallel_processor: capacity refills
+    continuously in proportion to elapsed time and each request spends one unit
+    of request capacity plus its estimated token count.
+    """
+    
+    def __init__(self, rpm: float, tpm: float):
+        """
+        Args:
+            rpm: Requests allowed per minute
+            tpm: Tokens (prompt + completion) allowed per minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_request_capacity = rpm
+        self.available_token_capacity = tpm
+        self._last_update = time.monotonic()
+        # Waiters queue on the lock so capacity is handed out in arrival order
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self.available_request_capacity = min(self.rpm, self.available_request_capacity + self.rpm * elapsed / 60)
+        self.available_token_capacity = min(self.tpm, self.available_token_capacity + self.tpm * elapsed / 60)
+    
+    async def acquire(self, tokens: int):
+        """Wait until one request and `tokens` tokens of capacity are available, then spend them."""
+        # A request larger than the whole bucket would otherwise wait forever
+        tokens = min(tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    return
+                wait = max(
+                    (1 - self.available_request_capacity) * 60 / self.rpm,
+                    (tokens - self.available_token_capacity) * 60 / self.tpm,
+                )
+                await asyncio.sleep(max(wait, 0.01))
+
 
 class VerseRangeProcessor:
     """Main processor for verse ranges and triple generation."""
     
-    def __init__(self, productions_dir: str, prompt_template_path: str = None, canonical_prompt_path: str = None, translation_prompt_path: str = None, ontology_path: Optional[str] = None, demo_path: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(self, productions_dir: str, prompt_template_path: str = None, canonical_prompt_path: str = None, translation_prompt_path: str = None, ontology_path: Optional[str] = None, demo_path: Optional[str] = None, api_key: Optional[str] = None, max_concurrency: int = 20, semantic_cache: bool = False, semantic_threshold: float = 0.95, strict_merge: bool = False, cache_dir: Optional[str] = str(LLM_CACHE_DIR), refresh_cache: bool = False, stream: bool = False, requests_per_minute: float = 500, tokens_per_minute: float = 500_000, max_attempts: int = 6):
         """
         Initialize the processor.
         
@@ -36,8 +402,28 @@ class VerseRangeProcessor:
             ontology_path: Path to the ontology file (default: Context/Ontology.ttl)
             demo_path: Path to the demo example file (default: Context/demo_grc.ttl)
             api_key: OpenAI API key (if None, reads from OPENAI_API_KEY env var)
+            max_concurrency: Maximum number of API requests in flight at once
+            semantic_cache: Reuse triples of near-identical passages from SEMANTIC_CACHE_DIR (requires numpy)
+            semantic_threshold: Minimum cosine similarity for a semantic cache hit
+            strict_merge: Merge canonical and translation TTL through rdflib instead of textually
+            cache_dir: Directory of the exact-response cache (None disables it)
+            refresh_cache: Never answer from the exact-response cache, but still store new responses
+                (used when regenerating existing outputs, which may be bad because of a bad cached response)
+            stream: Stream responses and strip the code fence as chunks arrive
+            requests_per_minute: Request rate limit shared by all API calls
+            tokens_per_minute: Token rate limit shared by all API calls (prompt tokens are counted with
+                tiktoken when it is installed, else estimated from the prompt length)
+            max_attempts: Attempts per API call before giving up on rate-limit, timeout, connection or server errors
         """
         self.productions_dir = Path(productions_dir)
+        # Names of verse ranges whose expected outputs all existed when find_verse_ranges scanned them
+        self._done: Set[str] = set()
+        # Verse text files read ahead of time by _read_all_texts: path -> stripped text
+        self._prefetched: Dict[Path, str] = {}
+        # Canonical triples already generated (and saved) by a packed multi-passage request: name -> TTL
+        self._packed_canonical: Dict[str, str] = {}
+        # Canonical TTL with Line :text stripped, shared by a range's translation merges: name -> TTL
+        self._canonical_cache: Dict[str, str] = {}
         # Support both old combined prompt and new separate prompts
         if prompt_template_path:
             # Old mode: use combined prompt
@@ -56,43 +442,90 @@ class VerseRangeProcessor:
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
         
-        self.client = OpenAI(api_key=self.api_key)
-        if self.prompt_template_path:
-            # Old mode
-            self.prompt_template = self._load_prompt_template()
-        else:
-            # New mode
-            self.canonical_prompt_template = self._load_prompt_template(self.canonical_prompt_path)
-            self.translation_prompt_template = self._load_prompt_template(self.translation_prompt_path)
-        self.ontology_content = self._load_ontology()
-        self.demo_content = self._load_demo()
+        # One pooled HTTP/2 client for every request, so concurrent calls share
+        # a few TLS connections instead of each paying for a handshake
+        limits = httpx.Limits(max_connections=max(max_concurrency, 50), max_keepalive_connections=max(max_concurrency, 50))
+        try:
+            self._http = httpx.AsyncClient(http2=True, timeout=httpx.Timeout(120.0), limits=limits)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package (httpx[http2])
+            print("  (h2 not installed; using HTTP/1.1 connections)", file=sys.stderr)
+            self._http = httpx.AsyncClient(timeout=httpx.Timeout(120.0), limits=limits)
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self._http)
+        # Bounds concurrent API requests across all verse ranges processed by process_all
+        self.max_concurrency = max_concurrency
+        self._api_semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = AsyncRateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_attempts = max_attempts
+        self.response_cache = ResponseCache(Path(cache_dir)) if cache_dir else None
+        self.refresh_cache = refresh_cache
+        self.semantic_cache = SemanticCache(self.client, threshold=semantic_threshold) if semantic_cache else None
+        self.stream = stream
+        # Models whose streaming requests were rejected (see _create_completion)
+        self._unstreamable_models: Set[str] = set()
+        self.strict_merge = strict_merge
+        # Shared by every request; never mutated
+        self._system_msg = {"role": "system", "content": SYSTEM_PROMPT}
+        # Templates pre-split around PASSAGE_PLACEHOLDER: template -> (head, placeholder, tail)
+        self._template_parts: Dict[str, Tuple[str, str, str]] = {}
+        # Templates with ontology and demo already injected (see _assemble_template)
+        self._assembled: Dict[str, Optional[Tuple[str, str, str, str]]] = {}
+        # The context files are independent, so read them concurrently
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            if self.prompt_template_path:
+                # Old mode
+                templates = {'prompt_template': pool.submit(self._load_prompt_template)}
+            else:
+                # New mode
+                templates = {
+                    'canonical_prompt_template': pool.submit(self._load_prompt_template, self.canonical_prompt_path),
+                    'translation_prompt_template': pool.submit(self._load_prompt_template, self.translation_prompt_path),
+                }
+            ontology = pool.submit(self._load_ontology)
+            demo = pool.submit(self._load_demo)
+            for name, future in templates.items():
+                setattr(self, name, future.result())
+            self.ontology_content = ontology.result()
+            self.demo_content = demo.result()
+        self._ontology_section = f"\n\n<ONTOLOGY>\n{self.ontology_content}\n</ONTOLOGY>\n\n"
+        self._demo_section = f"<EXAMPLE>\n{self.demo_content}\n</EXAMPLE>\n\n"
+        # Partially evaluate the loaded templates up front; other templates are assembled on first use
+        for name in templates:
+            template = getattr(self, name)
+            self._assembled[template] = self._assemble_template(template)
     
     def _load_prompt_template(self, path: Path = None) -> str:
         """Load the prompt template from file."""
         template_path = path or self.prompt_template_path
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            template = _read_text_file(str(template_path))
         except FileNotFoundError:
             raise FileNotFoundError(f"Prompt template not found: {template_path}")
+        self._split_template(template)
+        return template
+    
+    def _split_template(self, prompt_template: str) -> Tuple[str, str, str]:
+        """Split a template around the passage placeholder once and cache the parts."""
+        parts = self._template_parts.get(prompt_template)
+        if parts is None:
+            parts = self._template_parts[prompt_template] = prompt_template.partition(PASSAGE_PLACEHOLDER)
+        return parts
     
     def _load_ontology(self) -> str:
         """Load the ontology file."""
         try:
-            with open(self.ontology_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_text_file(str(self.ontology_path))
         except FileNotFoundError:
             raise FileNotFoundError(f"Ontology file not found: {self.ontology_path}")
     
     def _load_demo(self) -> str:
         """Load the demo example file."""
         try:
-            with open(self.demo_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_text_file(str(self.demo_path))
         except FileNotFoundError:
             raise FileNotFoundError(f"Demo file not found: {self.demo_path}")
     
-    def _merge_canonical_with_translations(self, canonical_ttl: str, translation_ttl: str) -> str:
+    def _merge_canonical_with_translations(self, canonical_ttl: str, translation_ttl: str, verse_range_name: Optional[str] = None) -> str:
         """
         Merge canonical TTL with translation TTL for [PRODUCTIONS]_TEST format.
         Removes :text from Line individuals in canonical (translation files have minimal Lines),
@@ -101,93 +534,250 @@ class VerseRangeProcessor:
         Args:
             canonical_ttl: Full canonical TTL (Scene, Speech, Lines with Greek text, semantic)
             translation_ttl: TTL containing only TranslationVariants (TV_Line_###_en or _ell)
+            verse_range_name: If given, the stripped canonical TTL is cached under this name
+                and reused by the range's other languages (see _canonical_cache)
             
         Returns:
             Merged TTL string
         """
+        # Parse the translation first, whichever merge is used: if it is broken there is nothing
+        # to merge, and the canonical TTL can be stripped without rdflib
+        trans_graph = Graph()
+        try:
+            trans_graph.parse(data=translation_ttl, format="turtle")
+        except Exception as e:
+            print(f"  WARNING: Translation triples failed to parse, saving canonical triples only: {e}", file=sys.stderr)
+            trans_graph = None
+            stripped = self._canonical_cache.get(verse_range_name) if verse_range_name else None
+            if stripped is None:
+                stripped = self._strip_line_text(canonical_ttl)
+            if stripped is not None:
+                return stripped
+        else:
+            if not self.strict_merge:
+                merged = self._merge_textual(canonical_ttl, translation_ttl, verse_range_name)
+                if merged is not None:
+                    return merged
+        
         ANTIGONE = Namespace("http://example.org/antigone#")
         
         graph = Graph()
         graph.parse(data=canonical_ttl, format="turtle")
         
-        # Remove :text from Line individuals (translation files have Lines without Greek text)
-        lines_with_text = [
-            (s, p, o) for s, p, o in graph
-            if p == ANTIGONE.text and (s, RDF.type, ANTIGONE.Line) in graph
-        ]
+        # Remove :text from Line individuals (translation files have Lines without Greek text),
+        # using the graph's predicate index rather than scanning every triple
+        lines = set(graph.subjects(RDF.type, ANTIGONE.Line))
+        lines_with_text = [(s, p, o) for s, p, o in graph.triples((None, ANTIGONE.text, None)) if s in lines]
         for triple in lines_with_text:
             graph.remove(triple)
         
-        # Parse and merge translation TTL (TranslationVariants)
-        trans_graph = Graph()
-        try:
-            trans_graph.parse(data=translation_ttl, format="turtle")
-        except Exception:
-            return canonical_ttl  # Fallback if translation parse fails
-        graph += trans_graph
+        # Merge translation TTL (TranslationVariants)
+        if trans_graph is not None:
+            graph += trans_graph
         
         return graph.serialize(format="turtle", encoding="utf-8").decode("utf-8")
     
-    def find_verse_ranges(self) -> List[str]:
+    def _merge_textual(self, canonical_ttl: str, translation_ttl: str, verse_range_name: Optional[str] = None) -> Optional[str]:
+        """
+        Merge without rdflib: drop :text from the canonical Line statements with a regex
+        and append the translation TTL, skipping @prefix lines the canonical already declares.
+        
+        Both documents are assumed to use the same prefix declarations (as the prompts
+        require), and the translation to have parsed already (see _merge_canonical_with_translations).
+        
+        Returns:
+            Merged TTL string, or None if the canonical TTL uses constructs the textual
+            merge cannot handle safely (long string literals, a different ':' namespace)
+        """
+        stripped = self._canonical_cache.get(verse_range_name) if verse_range_name else None
+        if stripped is None:
+            stripped = self._strip_line_text(canonical_ttl)
+            if stripped is None:
+                return None
+            if verse_range_name:
+                self._canonical_cache[verse_range_name] = stripped
+        declared = {line.strip() for line in _PREFIX_LINE_RE.findall(canonical_ttl)}
+        translation = _PREFIX_LINE_RE.sub(lambda m: '' if m.group(0).strip() in declared else m.group(0), translation_ttl)
+        return f"{stripped.rstrip()}\n\n{translation.strip()}\n"
+    
+    def _strip_line_text(self, canonical_ttl: str) -> Optional[str]:
+        """
+        Drop :text from the Line statements of canonical TTL with regexes (no rdflib).
+        
+        Returns:
+            Stripped TTL, or None if the TTL uses constructs this cannot handle safely
+            (long string literals, a different ':' namespace)
+        """
+        if '"""' in canonical_ttl or "'''" in canonical_ttl or not _ANTIGONE_DEFAULT_PREFIX_RE.search(canonical_ttl):
+            return None
+        
+        def strip_statement(match: re.Match) -> str:
+            statement = match.group(0)
+            if not _LINE_TYPE_RE.search(statement):
+                return statement
+            # A trailing ':text ... .' leaves the previous predicate's ';' dangling before the '.'
+            return _DANGLING_SEMICOLON_RE.sub(' .', _LINE_TEXT_RE.sub('', statement))
+        
+        return _TTL_STATEMENT_RE.sub(strip_statement, canonical_ttl)
+    
+    def get_verse_range(self, name: str) -> VerseRange:
+        """
+        Parse a verse range directory name into a VerseRange.
+        
+        Args:
+            name: Verse range directory name (e.g., 'verse_773_to_805')
+            
+        Returns:
+            VerseRange located in the [PRODUCTIONS] directory
+        """
+        return self._parse_verse_range(self.productions_dir, name)
+    
+    @staticmethod
+    def _parse_verse_range(productions_dir: Path, name: str) -> VerseRange:
+        match = _VERSE_RE.match(name)
+        if not match:
+            raise ValueError(f"Invalid verse range format: {name}")
+        start_verse, end_verse = match.groups()
+        return VerseRange(name, start_verse, end_verse, productions_dir / name)
+    
+    @classmethod
+    def from_single(cls, productions_dir: str, verse_range: str, **kwargs) -> Tuple['VerseRangeProcessor', VerseRange]:
+        """
+        Build a processor for a run over one verse range.
+        
+        The range is validated before anything else is loaded, so a bad name or a missing
+        Ancient Greek or English source file (both are read for the canonical stage) fails
+        immediately, and the [PRODUCTIONS] directory is never scanned. Modern Greek is
+        optional: it is only translated when its source file exists.
+        
+        Args:
+            productions_dir: Path to the [PRODUCTIONS] directory
+            verse_range: Verse range directory name (e.g., 'verse_773_to_805')
+            **kwargs: Remaining VerseRangeProcessor arguments
+            
+        Returns:
+            Tuple of (processor, verse_range)
+        """
+        parsed = cls._parse_verse_range(Path(productions_dir), verse_range)
+        ancient_greek_file = parsed.dir / 'ancient_greek' / f'aGR_{parsed.start}_to_{parsed.end}.txt'
+        if not ancient_greek_file.is_file():
+            raise FileNotFoundError(f"Ancient Greek file not found: {ancient_greek_file}")
+        # English: en_ (PRODUCTIONS) or aEN_ (TEST), as in read_verse_texts
+        english_files = [
+            parsed.dir / 'english' / f'{prefix}_{parsed.start}_to_{parsed.end}.txt' for prefix in ('en', 'aEN')
+        ]
+        if not any(path.is_file() for path in english_files):
+            raise FileNotFoundError(f"English file not found: {english_files[-1]}")
+        return cls(productions_dir, **kwargs), parsed
+    
+    def find_verse_ranges(self, skip_existing: bool = True) -> List[VerseRange]:
         """
         Scan the [PRODUCTIONS] directory for verse range directories.
         
+        Args:
+            skip_existing: Record ranges whose outputs all exist (see iter_verse_ranges)
+        
         Returns:
-            List of verse range directory names (e.g., ['verse_773_to_805', ...])
+            List of verse ranges sorted by directory name (e.g., verse_773_to_805, ...)
+        """
+        return sorted(self.iter_verse_ranges(skip_existing), key=lambda vr: vr.name)
+    
+    def iter_verse_ranges(self, skip_existing: bool = True) -> Iterator[VerseRange]:
+        """
+        Yield verse range directories in directory-listing order as they are scanned,
+        so work can start before the whole [PRODUCTIONS] directory has been read.
+        
+        Args:
+            skip_existing: Record ranges whose expected outputs all exist in _done; without it
+                the output folders are not listed at all
+        
+        Returns:
+            Iterator over verse ranges (unsorted; see find_verse_ranges)
         """
-        verse_ranges = []
         if not self.productions_dir.exists():
             raise FileNotFoundError(f"Productions directory not found: {self.productions_dir}")
         
-        for item in self.productions_dir.iterdir():
-            if item.is_dir() and item.name.startswith('verse_') and 'chinese' not in item.name.lower():
-                verse_ranges.append(item.name)
+        # scandir entries carry the file type from the directory listing, so filtering costs no extra stat calls
+        with os.scandir(self.productions_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith('verse_') or 'chinese' in entry.name.lower() or not entry.is_dir():
+                    continue
+                try:
+                    verse_range = self.get_verse_range(entry.name)
+                except ValueError as e:
+                    print(f"Skipping {entry.name}: {e}", file=sys.stderr)
+                    continue
+                if skip_existing and self._outputs_complete(verse_range):
+                    self._done.add(verse_range.name)
+                yield verse_range
+    
+    def _outputs_complete(self, verse_range: VerseRange) -> bool:
+        """
+        Check whether every expected output.ttl of a verse range exists, listing each
+        language folder once with os.scandir instead of probing files one by one.
+        """
+        listing: Dict[str, Set[str]] = {}
+        with os.scandir(verse_range.dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as files:
+                        listing[entry.name] = {f.name for f in files}
         
-        return sorted(verse_ranges)
+        start_verse, end_verse = verse_range.start, verse_range.end
+        expected_langs = ['ancient_greek']
+        # In old combined mode, only ancient_greek is produced
+        if not self.prompt_template_path:
+            english_files = listing.get('english', set())
+            if f'en_{start_verse}_to_{end_verse}.txt' in english_files or f'aEN_{start_verse}_to_{end_verse}.txt' in english_files:
+                expected_langs.append('english')
+            if f'mGR_{start_verse}_to_{end_verse}.txt' in listing.get('modern_greek', set()):
+                expected_langs.append('modern_greek')
+        return all('output.ttl' in listing.get(lang, set()) for lang in expected_langs)
     
-    def get_available_languages(self, verse_range: str) -> List[str]:
+    def get_available_languages(self, verse_range: VerseRange) -> Dict[str, Path]:
         """
         Detect which translation languages have input files for a verse range.
+        Each language folder is listed once with os.scandir rather than probed file by file.
         
         Returns:
-            List of language folder names: ['ancient_greek', 'english', 'modern_greek'] (modern_greek only if source exists)
+            Language folder name -> input text file, in the order ancient_greek, english,
+            modern_greek (modern_greek only if source exists)
         """
-        verse_dir = self.productions_dir / verse_range
-        match = re.search(r'verse_(\d+)_to_(\d+)', verse_range)
-        if not match:
-            raise ValueError(f"Invalid verse range format: {verse_range}")
-        start_verse, end_verse = match.groups()
+        verse_dir = verse_range.dir
+        start_verse, end_verse = verse_range.start, verse_range.end
+        
+        def list_dir(name: str) -> Set[str]:
+            try:
+                with os.scandir(verse_dir / name) as entries:
+                    return {entry.name for entry in entries}
+            except FileNotFoundError:
+                return set()
         
-        languages = ['ancient_greek']  # Required
+        languages = {'ancient_greek': verse_dir / 'ancient_greek' / f'aGR_{start_verse}_to_{end_verse}.txt'}  # Required
         # English: support en_ (PRODUCTIONS) and aEN_ (TEST)
-        en_file = verse_dir / 'english' / f'en_{start_verse}_to_{end_verse}.txt'
-        aen_file = verse_dir / 'english' / f'aEN_{start_verse}_to_{end_verse}.txt'
-        if en_file.exists() or aen_file.exists():
-            languages.append('english')
+        english_files = list_dir('english')
+        for name in (f'en_{start_verse}_to_{end_verse}.txt', f'aEN_{start_verse}_to_{end_verse}.txt'):
+            if name in english_files:
+                languages['english'] = verse_dir / 'english' / name
+                break
         # Modern Greek: optional
-        mgr_file = verse_dir / 'modern_greek' / f'mGR_{start_verse}_to_{end_verse}.txt'
-        if mgr_file.exists():
-            languages.append('modern_greek')
+        mgr_name = f'mGR_{start_verse}_to_{end_verse}.txt'
+        if mgr_name in list_dir('modern_greek'):
+            languages['modern_greek'] = verse_dir / 'modern_greek' / mgr_name
         return languages
     
-    def read_verse_texts(self, verse_range: str) -> Tuple[str, str]:
+    def read_verse_texts(self, verse_range: VerseRange) -> Tuple[str, str]:
         """
         Read ancient Greek and English text files for a verse range.
         
         Args:
-            verse_range: Verse range directory name (e.g., 'verse_773_to_805')
+            verse_range: Verse range (e.g., verse_773_to_805)
             
         Returns:
             Tuple of (ancient_greek_text, english_text)
         """
-        verse_dir = self.productions_dir / verse_range
-        
-        # Extract verse numbers from directory name
-        match = re.search(r'verse_(\d+)_to_(\d+)', verse_range)
-        if not match:
-            raise ValueError(f"Invalid verse range format: {verse_range}")
-        
-        start_verse, end_verse = match.groups()
+        verse_dir = verse_range.dir
+        start_verse, end_verse = verse_range.start, verse_range.end
         
         # Read ancient Greek file
         ancient_greek_file = verse_dir / 'ancient_greek' / f'aGR_{start_verse}_to_{end_verse}.txt'
@@ -200,30 +790,28 @@ class VerseRangeProcessor:
         if not english_file.exists():
             raise FileNotFoundError(f"English file not found: {english_file}")
         
-        with open(ancient_greek_file, 'r', encoding='utf-8') as f:
-            ancient_greek_text = f.read().strip()
-        
-        with open(english_file, 'r', encoding='utf-8') as f:
-            english_text = f.read().strip()
+        ancient_greek_text = self._read_text(ancient_greek_file)
+        english_text = self._read_text(english_file)
         
         return ancient_greek_text, english_text
     
-    def read_translation_text(self, verse_range: str, language: str) -> str:
+    def read_translation_text(self, verse_range: VerseRange, language: str, path: Optional[Path] = None) -> str:
         """
         Read translation text for a given language.
         
         Args:
-            verse_range: Verse range directory name
+            verse_range: Verse range
             language: 'english' or 'modern_greek'
+            path: Input file already resolved by get_available_languages, if known
             
         Returns:
             Text content
         """
-        verse_dir = self.productions_dir / verse_range
-        match = re.search(r'verse_(\d+)_to_(\d+)', verse_range)
-        if not match:
-            raise ValueError(f"Invalid verse range format: {verse_range}")
-        start_verse, end_verse = match.groups()
+        if path is not None:
+            return self._read_text(path)
+        
+        verse_dir = verse_range.dir
+        start_verse, end_verse = verse_range.start, verse_range.end
         
         if language == 'english':
             path = verse_dir / 'english' / f'en_{start_verse}_to_{end_verse}.txt'
@@ -236,8 +824,67 @@ class VerseRangeProcessor:
         
         if not path.exists():
             raise FileNotFoundError(f"Translation file not found: {path}")
-        with open(path, 'r', encoding='utf-8') as f:
-            return f.read().strip()
+        return self._read_text(path)
+    
+    def _read_text(self, path: Path) -> str:
+        """Return the stripped text of an input file, from the prefetched texts if available."""
+        text = self._prefetched.get(path)
+        if text is None:
+            # Decode raw bytes directly rather than going through a buffered text wrapper
+            text = path.read_bytes().decode('utf-8').strip()
+        return text
+    
+    def _read_all_texts(self, verse_ranges: List[VerseRange], max_workers: int = 32):
+        """
+        Read the input text files of many verse ranges at once, before any API calls are made.
+        
+        Reads are issued from a thread pool so the kernel can overlap them instead of
+        each range blocking on its own files later; missing files are simply skipped.
+        
+        Args:
+            verse_ranges: Verse ranges whose input files should be read
+            max_workers: Number of reader threads
+        """
+        paths = []
+        for verse_range in verse_ranges:
+            start_verse, end_verse = verse_range.start, verse_range.end
+            paths += [
+                verse_range.dir / 'ancient_greek' / f'aGR_{start_verse}_to_{end_verse}.txt',
+                verse_range.dir / 'english' / f'en_{start_verse}_to_{end_verse}.txt',
+                verse_range.dir / 'english' / f'aEN_{start_verse}_to_{end_verse}.txt',
+                verse_range.dir / 'modern_greek' / f'mGR_{start_verse}_to_{end_verse}.txt',
+            ]
+        
+        def read(path: Path) -> Optional[bytes]:
+            try:
+                return path.read_bytes()
+            except FileNotFoundError:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for path, data in zip(paths, pool.map(read, paths)):
+                if data is not None:
+                    self._prefetched[path] = data.decode('utf-8').strip()
+    
+    def build_canonical_prompt(self, verse_range: VerseRange) -> str:
+        """
+        Build the canonical prompt for a verse range (combined Greek + English prompt in old mode).
+        
+        Args:
+            verse_range: Verse range
+            
+        Returns:
+            Complete prompt string
+        """
+        passage, prompt_template = self._canonical_passage(verse_range)
+        return self.build_prompt(passage, prompt_template)
+    
+    def _canonical_passage(self, verse_range: VerseRange) -> Tuple[str, str]:
+        """Return (passage, prompt template) for the canonical stage of a verse range."""
+        ancient_greek_text, english_text = self.read_verse_texts(verse_range)
+        if self.prompt_template_path:
+            return f"[Ancient Greek - CANONICAL ANCHOR]\n{ancient_greek_text}\n\n[English Translation]\n{english_text}", self.prompt_template
+        return ancient_greek_text, self.canonical_prompt_template
     
     def build_prompt(self, text: str, prompt_template: str, canonical_content: str = None) -> str:
         """
@@ -251,30 +898,89 @@ class VerseRangeProcessor:
         Returns:
             Complete prompt string
         """
+        if prompt_template not in self._assembled:
+            self._assembled[prompt_template] = self._assemble_template(prompt_template)
+        assembled = self._assembled[prompt_template]
+        if assembled is not None:
+            # Fast path: only the canonical section and the passage vary per call
+            prefix, canonical_format, middle, tail = assembled
+            canonical_section = canonical_format.format(canonical_content) if canonical_content else ""
+            return f"{prefix}{canonical_section}{middle}{text}{tail}"
+        
         # Build the complete prompt: template + ontology + demo + text
-        prompt = prompt_template.replace('{{ INSERT PASSAGE HERE }}', text)
+        head, placeholder, tail = self._split_template(prompt_template)
+        prompt = f"{head}{text}{tail}" if placeholder else prompt_template
         
         # Insert ontology and demo before the text section
         # Find where to insert (before <TEXT> tag)
         if '<TEXT>' in prompt:
             # Insert ontology and demo right before <TEXT>
-            ontology_section = f"\n\n<ONTOLOGY>\n{self.ontology_content}\n</ONTOLOGY>\n\n"
-            demo_section = f"<EXAMPLE>\n{self.demo_content}\n</EXAMPLE>\n\n"
+            ontology_section = self._ontology_section
+            demo_section = self._demo_section
             
             # For translation prompts, also include canonical content if provided
             canonical_section = ""
             if canonical_content:
                 canonical_section = f"<CANONICAL_TRIPLES>\n{canonical_content}\n</CANONICAL_TRIPLES>\n\n"
             
-            prompt = prompt.replace('<TEXT>', ontology_section + demo_section + canonical_section + '<TEXT>')
+            # Only before the last <TEXT> (the passage block): the instructions mention <TEXT>
+            # too, and inserting there duplicated the ontology and demo and pushed the per-range
+            # canonical triples to the very start of the prompt, defeating prefix caching
+            before, marker, after = prompt.rpartition('<TEXT>')
+            prompt = before + ontology_section + demo_section + canonical_section + marker + after
         else:
-            # Fallback: append ontology and demo at the end before the text
+            # Fallback: place ontology and demo after the template instructions but before the
+            # passage, so every prompt built from this template shares the same static prefix
+            # (OpenAI prompt caching only matches identical prefixes)
             canonical_section = f"\n\n<CANONICAL_TRIPLES>\n{canonical_content}\n</CANONICAL_TRIPLES>\n\n" if canonical_content else ""
-            prompt = f"{prompt}\n\n<ONTOLOGY>\n{self.ontology_content}\n</ONTOLOGY>\n\n<EXAMPLE>\n{self.demo_content}\n</EXAMPLE>{canonical_section}"
+            static_sections = f"\n\n<ONTOLOGY>\n{self.ontology_content}\n</ONTOLOGY>\n\n<EXAMPLE>\n{self.demo_content}\n</EXAMPLE>{canonical_section}"
+            if placeholder:
+                prompt = f"{head}{static_sections}\n\n{text}{tail}"
+            else:
+                prompt = f"{prompt}{static_sections}"
         
         return prompt
     
-    def call_chatgpt_api(self, prompt: str, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000) -> str:
+    def _assemble_template(self, prompt_template: str) -> Optional[Tuple[str, str, str, str]]:
+        """
+        Inject the ontology and demo into a template once, so build_prompt only has to
+        add the canonical section and the passage.
+        
+        Returns:
+            Tuple of (prefix, canonical section format, middle, tail) such that a prompt is
+            prefix + canonical section + middle + passage + tail, or None if the template has
+            no passage placeholder or a <TEXT> tag only after it (build_prompt then builds
+            the prompt from scratch)
+        """
+        head, placeholder, tail = self._split_template(prompt_template)
+        if not placeholder:
+            return None
+        if '<TEXT>' in head:
+            before, marker, after = head.rpartition('<TEXT>')
+            if '<TEXT>' in tail:
+                return None
+            canonical_format = "<CANONICAL_TRIPLES>\n{}\n</CANONICAL_TRIPLES>\n\n"
+            return before + self._ontology_section + self._demo_section, canonical_format, marker + after, tail
+        if '<TEXT>' in tail:
+            return None
+        static_prefix = f"{head}\n\n<ONTOLOGY>\n{self.ontology_content}\n</ONTOLOGY>\n\n<EXAMPLE>\n{self.demo_content}\n</EXAMPLE>"
+        return static_prefix, "\n\n<CANONICAL_TRIPLES>\n{}\n</CANONICAL_TRIPLES>\n\n", "\n\n", tail
+    
+    def _build_api_params(self, prompt: str, model: str, temperature: float, max_tokens: int) -> Dict:
+        """Build the chat completions request body (shared by direct calls and the Batch API)."""
+        api_params = {
+            "model": model,
+            "messages": [self._system_msg, {"role": "user", "content": prompt}],
+            "temperature": temperature,
+            # Requests built from the same template share a long static prefix (instructions,
+            # ontology, demo); keying on the start of the prompt routes them to the same
+            # prompt cache without having to thread the template through every caller
+            "prompt_cache_key": hashlib.sha256(prompt[:PROMPT_CACHE_KEY_CHARS].encode('utf-8')).hexdigest()[:32]
+        }
+        api_params[_max_tokens_param(model)] = max_tokens
+        return api_params
+    
+    async def call_chatgpt_api(self, prompt: str, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000, label: Optional[str] = None) -> str:
         """
         Call ChatGPT API to generate RDF triples.
         
@@ -283,33 +989,176 @@ class VerseRangeProcessor:
             model: OpenAI model to use
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            label: Progress message prefix (e.g. "[verse_1_to_10] canonical") used to report a cache hit
             
         Returns:
             Generated RDF/Turtle triples
         """
-        try:
-            # GPT-5.2 uses max_completion_tokens instead of max_tokens
-            api_params = {
+        api_params = self._build_api_params(prompt, model, temperature, max_tokens)
+        # Older openai 1.x SDKs reject prompt_cache_key as a keyword argument; extra_body sends
+        # it in the request JSON on every version (Batch API bodies carry it as a plain field)
+        api_params["extra_body"] = {"prompt_cache_key": api_params.pop("prompt_cache_key")}
+        
+        key = None
+        if self.response_cache:
+            key = ResponseCache.key({
                 "model": model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert annotator of Ancient Greek tragedies and an ontology-aware triple extractor."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": temperature
-            }
+                "messages": api_params["messages"],
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            })
+            cached = None if self.refresh_cache else await asyncio.to_thread(self.response_cache.get, key)
+            if cached is not None:
+                if label:
+                    print(f"  {label}: reusing cached API response (use --no-skip-existing to request a new one)")
+                return cached
+        
+        if self.stream and model not in self._unstreamable_models:
+            api_params["stream"] = True
+        # What the request can spend against the TPM limit: prompt tokens plus the full completion budget
+        est_tokens = _system_prompt_tokens(model) + _count_tokens(prompt, model) + max_tokens
+        content = await self._create_completion(api_params, est_tokens)
+        
+        if key is not None:
+            await asyncio.to_thread(self.response_cache.put, key, content)
+        return content
+    
+    async def _create_completion(self, api_params: Dict, est_tokens: int) -> str:
+        """
+        Send a chat completion request, retrying transient failures.
+        
+        Rate limits, timeouts, dropped connections and 5xx responses are retried with
+        randomized exponential backoff; anything else (e.g. a 400 for a bad request)
+        is raised immediately with its original OpenAI exception type.
+        
+        Args:
+            api_params: Request body (see _build_api_params)
+            est_tokens: Estimated prompt + completion tokens, charged to the rate limiter
             
-            # Use max_completion_tokens for GPT-5.x models, max_tokens for older models
-            if model.startswith("gpt-5"):
-                api_params["max_completion_tokens"] = max_tokens
-            else:
-                api_params["max_tokens"] = max_tokens
+        Returns:
+            Response content, stripped
+        """
+        async for attempt in AsyncRetrying(
+            wait=wait_random_exponential(min=1, max=60),
+            stop=stop_after_attempt(self.max_attempts),
+            retry=retry_if_exception_type((RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)),
+            before_sleep=self._log_retry,
+            reraise=True
+        ):
+            with attempt:
+                await self._rate_limiter.acquire(est_tokens)
+                async with self._api_semaphore:
+                    if api_params.get("stream"):
+                        try:
+                            response = await self.client.chat.completions.create(**api_params)
+                            return await self._consume_stream(response)
+                        except BadRequestError as e:
+                            if e.param != "stream" and "stream" not in str(e).lower():
+                                raise
+                            # Model (or organization) cannot stream: use a plain request from now on
+                            print(f"  Streaming not available for {api_params['model']}, falling back to non-streaming requests", file=sys.stderr)
+                            self._unstreamable_models.add(api_params["model"])
+                            api_params = {k: v for k, v in api_params.items() if k != "stream"}
+                    response = await self.client.chat.completions.create(**api_params)
+                return response.choices[0].message.content.strip()
+    
+    def _log_retry(self, retry_state: RetryCallState):
+        """Report a transient API failure and the upcoming retry on stderr."""
+        error = retry_state.outcome.exception()
+        print(
+            f"  API call failed ({type(error).__name__}: {error}); retrying in {retry_state.next_action.sleep:.1f}s "
+            f"(attempt {retry_state.attempt_number + 1}/{self.max_attempts})",
+            file=sys.stderr
+        )
+    
+    async def call_chatgpt_api_multi(self, passages: List[Tuple[str, str]], prompt_template: str, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000) -> Dict[str, str]:
+        """
+        Generate triples for several passages with a single chat completion.
+        
+        The passages are packed into one prompt as <PASSAGE id="..."> blocks and the model
+        answers with one <OUTPUT id="..."> block per passage, so N passages cost one request
+        (one round trip and one slot against the RPM limit) instead of N. Tagged blocks keep
+        the Turtle unescaped, and a malformed block only loses its own passage.
+        
+        Args:
+            passages: List of (id, passage) pairs, e.g. (verse range name, Ancient Greek text)
+            prompt_template: The prompt template to insert the packed passages into
+            model: OpenAI model to use
+            temperature: Sampling temperature
+            max_tokens: Maximum response tokens per passage (the request gets len(passages) times this)
             
-            response = self.client.chat.completions.create(**api_params)
+        Returns:
+            Dict mapping passage id to clean RDF/Turtle triples; ids missing from the response are left out
+        """
+        packed = MULTI_PASSAGE_INSTRUCTIONS + "\n\n".join(
+            f'<PASSAGE id="{passage_id}">\n{passage}\n</PASSAGE>' for passage_id, passage in passages
+        )
+        prompt = self.build_prompt(packed, prompt_template)
+        label = "[" + ", ".join(passage_id for passage_id, _ in passages) + "] packed"
+        api_response = await self.call_chatgpt_api(prompt, model, temperature, max_tokens * len(passages), label=label)
+        
+        ids = {passage_id for passage_id, _ in passages}
+        results = {}
+        for passage_id, block in _OUTPUT_BLOCK_RE.findall(api_response):
+            if passage_id in ids:
+                results[passage_id] = self.extract_triples(block)
+        return results
+    
+    async def _consume_stream(self, stream) -> str:
+        """
+        Collect a streamed completion, stripping the code fence on the fly so the
+        full response never has to be regex-scanned afterwards.
+        """
+        stripper = _FenceStripper()
+        buffer = io.StringIO()
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                buffer.write(stripper.feed(chunk.choices[0].delta.content))
+        buffer.write(stripper.finish())
+        return buffer.getvalue().strip()
+    
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._http.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def generate_triples(self, verse_range: VerseRange, prompt: str, passage: str, stage: str, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000) -> str:
+        """
+        Generate triples for a prompt, consulting the semantic cache first when it is enabled.
+        
+        Args:
+            verse_range: Verse range the prompt belongs to (for progress messages)
+            prompt: The complete prompt
+            passage: The verse text inserted into the prompt (what the semantic cache embeds)
+            stage: Pipeline stage, e.g. 'canonical' or 'translation:english' (cache scope)
+            model: OpenAI model to use
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
             
-            return response.choices[0].message.content.strip()
+        Returns:
+            Clean RDF/Turtle triples
+        """
+        embedding = None
+        scope = f"{model}|{stage}"
+        if self.semantic_cache:
+            async with self._api_semaphore:
+                embedding = await self.semantic_cache.embed(passage)
+            hit = self.semantic_cache.lookup(scope, embedding)
+            if hit:
+                triples, similarity = hit
+                print(f"  [{verse_range}] Semantic cache hit for {stage} (similarity {similarity:.3f})")
+                return triples
         
-        except Exception as e:
-            raise RuntimeError(f"API call failed: {str(e)}")
+        api_response = await self.call_chatgpt_api(prompt, model, temperature, max_tokens, label=f"[{verse_range}] {stage}")
+        triples = self.extract_triples(api_response)
+        if embedding is not None:
+            self.semantic_cache.store(scope, passage, embedding, triples)
+        return triples
     
     def extract_triples(self, api_response: str) -> str:
         """
@@ -321,42 +1170,28 @@ class VerseRangeProcessor:
         Returns:
             Clean RDF/Turtle triples
         """
-        # Remove any markdown code blocks if present
-        triple_text = api_response
-        
-        # Remove markdown code blocks
-        if '```' in triple_text:
-            # Extract content between ```turtle or ``` and ```
-            pattern = r'```(?:turtle|ttl)?\s*\n(.*?)\n```'
-            match = re.search(pattern, triple_text, re.DOTALL)
-            if match:
-                triple_text = match.group(1)
-            else:
-                # Try without language identifier
-                pattern = r'```\s*\n(.*?)\n```'
-                match = re.search(pattern, triple_text, re.DOTALL)
-                if match:
-                    triple_text = match.group(1)
-        
-        return triple_text.strip()
+        # Extract content between ```turtle (or ```) and ```, if present
+        match = _FENCE_RE.search(api_response)
+        return (match.group(1) if match else api_response).strip()
     
-    def save_triples(self, verse_range: str, triples: str, language: str) -> Path:
+    def save_triples(self, verse_range: VerseRange, triples: str, language: str) -> Path:
         """
         Save generated triples to {language}/output.ttl (PRODUCTIONS_TEST format).
         
         Args:
-            verse_range: Verse range directory name
+            verse_range: Verse range
             triples: RDF/Turtle triples to save
             language: 'ancient_greek', 'english', or 'modern_greek'
             
         Returns:
             Path to the saved file
         """
-        verse_dir = self.productions_dir / verse_range
-        output_file = verse_dir / language / 'output.ttl'
+        output_file = verse_range.dir / language / 'output.ttl'
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(triples)
+        # Write then rename, so a crash never leaves a partial output.ttl that a rerun would skip or merge
+        tmp_file = output_file.with_suffix('.ttl.tmp')
+        tmp_file.write_text(triples, encoding='utf-8')
+        os.replace(tmp_file, output_file)
         return output_file
     
     def _validate_output(self, output_path: Path, ontology_path: Optional[Path] = None) -> bool:
@@ -385,13 +1220,13 @@ class VerseRangeProcessor:
             print(f"  Validation failed: {e}", file=sys.stderr)
             return False
     
-    def process_verse_range(self, verse_range: str, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000, skip_existing: bool = True, validate: bool = True) -> Optional[List[Path]]:
+    async def process_verse_range(self, verse_range: VerseRange, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000, skip_existing: bool = True, validate: bool = True) -> Optional[List[Path]]:
         """
         Process a single verse range: generate canonical -> ancient_greek/output.ttl;
         for each translation language: generate TV -> merge -> {language}/output.ttl.
         
         Args:
-            verse_range: Verse range directory name
+            verse_range: Verse range (see get_verse_range / find_verse_ranges)
             model: OpenAI model to use
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
@@ -401,74 +1236,136 @@ class VerseRangeProcessor:
         Returns:
             List of output paths, or None if skipped
         """
+        packed_canonical = self._packed_canonical.pop(verse_range.name, None)
         languages = self.get_available_languages(verse_range)
-        verse_dir = self.productions_dir / verse_range
+        verse_dir = verse_range.dir
         # In old combined mode, only ancient_greek is produced
         expected_langs = ['ancient_greek'] if self.prompt_template_path else languages
         expected_outputs = [verse_dir / lang / 'output.ttl' for lang in expected_langs]
         
-        if skip_existing and all(p.exists() for p in expected_outputs):
+        if skip_existing and packed_canonical is None and all(p.exists() for p in expected_outputs):
             print(f"Skipping {verse_range} - output files already exist")
             return None
         
         print(f"Processing {verse_range}...")
         
         try:
-            # Read ancient Greek (required)
-            ancient_greek_text, english_text = self.read_verse_texts(verse_range)
-            
             # 1. Generate and save canonical (ancient_greek/output.ttl)
             ancient_greek_path = verse_dir / 'ancient_greek' / 'output.ttl'
-            if not ancient_greek_path.exists() or not skip_existing:
-                print(f"  Generating canonical triples...")
-                if self.prompt_template_path:
-                    prompt = self.build_prompt(f"[Ancient Greek - CANONICAL ANCHOR]\n{ancient_greek_text}\n\n[English Translation]\n{english_text}", self.prompt_template)
-                else:
-                    prompt = self.build_prompt(ancient_greek_text, self.canonical_prompt_template)
-                api_response = self.call_chatgpt_api(prompt, model, temperature, max_tokens)
-                canonical_triples = self.extract_triples(api_response)
-                ancient_greek_path = self.save_triples(verse_range, canonical_triples, 'ancient_greek')
-                print(f"  Saved to: {ancient_greek_path}")
+            if packed_canonical is not None:
+                # Generated, saved and validated by _generate_canonical_packed
+                canonical_triples = packed_canonical
+            elif not ancient_greek_path.exists() or not skip_existing:
+                print(f"  [{verse_range}] Generating canonical triples...")
+                passage, prompt_template = await asyncio.to_thread(self._canonical_passage, verse_range)
+                prompt = self.build_prompt(passage, prompt_template)
+                stage = 'combined' if self.prompt_template_path else 'canonical'
+                canonical_triples = await self.generate_triples(verse_range, prompt, passage, stage, model, temperature, max_tokens)
+                ancient_greek_path = await asyncio.to_thread(self.save_triples, verse_range, canonical_triples, 'ancient_greek')
+                print(f"  [{verse_range}] Saved to: {ancient_greek_path}")
                 if validate:
-                    self._validate_output(ancient_greek_path)
+                    await asyncio.to_thread(self._validate_output, ancient_greek_path)
             else:
-                print(f"  ancient_greek/output.ttl already exists, skipping...")
-                with open(ancient_greek_path, 'r', encoding='utf-8') as f:
-                    canonical_triples = f.read()
+                print(f"  [{verse_range}] ancient_greek/output.ttl already exists, skipping...")
+                canonical_triples = await asyncio.to_thread(ancient_greek_path.read_text, encoding='utf-8')
             
             output_paths = [ancient_greek_path]
             
-            # 2. For each translation language: generate TV, merge, save (skip in old combined mode)
+            # 2. Translation languages are independent given the canonical TTL, so generate them
+            #    concurrently: TV -> merge -> save (skip in old combined mode)
             if not self.prompt_template_path:
-                for lang in languages:
-                    if lang == 'ancient_greek':
-                        continue
-                    trans_path = verse_dir / lang / 'output.ttl'
-                    if trans_path.exists() and skip_existing:
-                        print(f"  {lang}/output.ttl already exists, skipping...")
-                        output_paths.append(trans_path)
-                        continue
-                    print(f"  Generating {lang} translation triples...")
-                    trans_text = self.read_translation_text(verse_range, lang)
-                    prompt = self.build_prompt(trans_text, self.translation_prompt_template, canonical_triples)
-                    api_response = self.call_chatgpt_api(prompt, model, temperature, max_tokens)
-                    translation_triples = self.extract_triples(api_response)
-                    merged = self._merge_canonical_with_translations(canonical_triples, translation_triples)
-                    trans_path = self.save_triples(verse_range, merged, lang)
-                    print(f"  Saved to: {trans_path}")
-                    if validate:
-                        self._validate_output(trans_path)
-                    output_paths.append(trans_path)
+                output_paths += await asyncio.gather(*(
+                    self._generate_translation(verse_range, lang, input_path, canonical_triples, model, temperature, max_tokens, skip_existing, validate)
+                    for lang, input_path in languages.items() if lang != 'ancient_greek'
+                ))
             
             return output_paths
         
         except Exception as e:
             print(f"  ERROR processing {verse_range}: {str(e)}", file=sys.stderr)
             raise
+        finally:
+            self._canonical_cache.pop(verse_range.name, None)
+    
+    def _prune_done(self, verse_ranges: List[VerseRange]) -> List[VerseRange]:
+        """Drop verse ranges whose outputs were all found by find_verse_ranges, before any work is dispatched."""
+        pending = [vr for vr in verse_ranges if vr.name not in self._done]
+        if len(pending) < len(verse_ranges):
+            print(f"Skipping {len(verse_ranges) - len(pending)} verse range(s) - output files already exist")
+        return pending
+    
+    async def _generate_canonical_packed(self, verse_ranges: List[VerseRange], passages_per_request: int, model: str, temperature: float, max_tokens: int, validate: bool):
+        """
+        Generate the canonical triples of many verse ranges with packed multi-passage requests.
+        
+        Results are saved to ancient_greek/output.ttl and handed to process_verse_range via
+        _packed_canonical. Ranges left out of a response (or of a failed request) are not
+        recorded and simply get their own request when process_verse_range runs.
+        """
+        passages = []
+        for verse_range in verse_ranges:
+            try:
+                passage, prompt_template = await asyncio.to_thread(self._canonical_passage, verse_range)
+            except Exception:
+                continue  # Reported when the range is processed on its own
+            passages.append((verse_range, passage))
+        if not passages:
+            return
+        
+        groups = [passages[i:i + passages_per_request] for i in range(0, len(passages), passages_per_request)]
+        print(f"Generating canonical triples for {len(passages)} verse range(s) in {len(groups)} packed request(s)...")
+        
+        async def run(group: List[Tuple[VerseRange, str]]):
+            try:
+                results = await self.call_chatgpt_api_multi(
+                    [(vr.name, passage) for vr, passage in group], prompt_template, model, temperature, max_tokens
+                )
+            except Exception as e:
+                names = ", ".join(vr.name for vr, _ in group)
+                print(f"  Packed request for {names} failed, falling back to one request per range: {str(e)}", file=sys.stderr)
+                return
+            for verse_range, _ in group:
+                triples = results.get(verse_range.name)
+                if triples is None:
+                    continue
+                output_path = await asyncio.to_thread(self.save_triples, verse_range, triples, 'ancient_greek')
+                print(f"  [{verse_range}] Saved to: {output_path}")
+                if validate:
+                    await asyncio.to_thread(self._validate_output, output_path)
+                self._packed_canonical[verse_range.name] = triples
+        
+        await asyncio.gather(*(run(group) for group in groups))
+        print()
+    
+    async def _generate_translation(self, verse_range: VerseRange, lang: str, input_path: Path, canonical_triples: str, model: str, temperature: float, max_tokens: int, skip_existing: bool, validate: bool) -> Path:
+        """
+        Generate the translation variant triples of one language, merge them with the
+        canonical triples and save {language}/output.ttl.
+        
+        Returns:
+            Path to the output file (the existing one if skipped)
+        """
+        trans_path = verse_range.dir / lang / 'output.ttl'
+        if trans_path.exists() and skip_existing:
+            print(f"  [{verse_range}] {lang}/output.ttl already exists, skipping...")
+            return trans_path
+        print(f"  [{verse_range}] Generating {lang} translation triples...")
+        trans_text = await asyncio.to_thread(self.read_translation_text, verse_range, lang, input_path)
+        prompt = self.build_prompt(trans_text, self.translation_prompt_template, canonical_triples)
+        translation_triples = await self.generate_triples(verse_range, prompt, trans_text, f'translation:{lang}', model, temperature, max_tokens)
+        merged = self._merge_canonical_with_translations(canonical_triples, translation_triples, verse_range.name)
+        trans_path = await asyncio.to_thread(self.save_triples, verse_range, merged, lang)
+        print(f"  [{verse_range}] Saved to: {trans_path}")
+        if validate:
+            await asyncio.to_thread(self._validate_output, trans_path)
+        return trans_path
     
-    def process_all(self, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000, skip_existing: bool = True, validate: bool = True):
+    async def process_all(self, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000, skip_existing: bool = True, validate: bool = True, passages_per_request: int = 1):
         """
         Process all verse ranges found in the [PRODUCTIONS] directory.
+        Verse ranges are queued as the directory is scanned and consumed by a pool of
+        max_concurrency workers; API calls are additionally throttled by the shared
+        RPM/TPM rate limiter.
         
         Args:
             model: OpenAI model to use
@@ -476,27 +1373,244 @@ class VerseRangeProcessor:
             max_tokens: Maximum tokens in response
             skip_existing: Skip if output files already exist
             validate: Run validation on generated files
+            passages_per_request: Pack up to this many canonical passages into one request (1 disables packing)
         """
-        verse_ranges = self.find_verse_ranges()
+        queue: asyncio.Queue = asyncio.Queue()
+        results: Dict[str, object] = {}
+        
+        async def worker():
+            while True:
+                verse_range = await queue.get()
+                if verse_range is None:
+                    return
+                try:
+                    results[verse_range.name] = await self.process_verse_range(verse_range, model, temperature, max_tokens, skip_existing, validate)
+                except Exception as e:
+                    results[verse_range.name] = e
+        
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+        # Ranges dropped (and already reported) by _prune_done in packed mode
+        pruned = 0
+        try:
+            if passages_per_request > 1:
+                # Packing needs every pending passage up front
+                verse_ranges = self.find_verse_ranges(skip_existing)
+                if skip_existing:
+                    found = len(verse_ranges)
+                    verse_ranges = self._prune_done(verse_ranges)
+                    pruned = found - len(verse_ranges)
+                # The full list is known before any request, so read every input file now
+                await asyncio.to_thread(self._read_all_texts, verse_ranges)
+                pending = [
+                    vr for vr in verse_ranges
+                    if not skip_existing or not (vr.dir / 'ancient_greek' / 'output.ttl').exists()
+                ]
+                await self._generate_canonical_packed(pending, passages_per_request, model, temperature, max_tokens, validate)
+                source = verse_ranges
+            else:
+                # Stream ranges to the workers while the directory is still being scanned. There is no
+                # up-front read here: each worker reads its range's files in a thread when it picks
+                # the range up, which already overlaps the reads with other ranges' API calls
+                source = self.iter_verse_ranges(skip_existing)
+            
+            verse_ranges = []
+            skipped = 0
+            for verse_range in source:
+                if skip_existing and verse_range.name in self._done:
+                    skipped += 1
+                    continue
+                verse_ranges.append(verse_range)
+                queue.put_nowait(verse_range)
+                await asyncio.sleep(0)  # Let an idle worker pick it up right away
+        finally:
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+        
+        if not verse_ranges and not skipped and not pruned:
+            print("No verse ranges found!")
+            return
+        if skipped:
+            print(f"Skipped {skipped} verse range(s) - output files already exist")
+        
+        # Report in name order regardless of scan order
+        verse_ranges.sort(key=lambda vr: vr.name)
+        print()
+        for verse_range in verse_ranges:
+            result = results[verse_range.name]
+            if isinstance(result, Exception):
+                print(f"Failed to process {verse_range}: {str(result)}", file=sys.stderr)
+            elif result:
+                paths_str = ", ".join(str(p) for p in result)
+                print(f"Completed {verse_range}: {paths_str}")
+        
+        print()
+        print("Processing complete!")
+    
+    async def submit_batch(self, prompts: Dict[str, str], model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000) -> str:
+        """
+        Upload prompts as a single JSONL file and create an OpenAI Batch job for them.
+        
+        Args:
+            prompts: Mapping of custom_id -> complete prompt
+            model: OpenAI model to use
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            
+        Returns:
+            The batch id
+        """
+        # orjson emits UTF-8 bytes directly, so the JSONL is built without a str round trip
+        lines = []
+        for custom_id, prompt in prompts.items():
+            lines.append(orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_api_params(prompt, model, temperature, max_tokens)
+            }))
+        batch_input = b"\n".join(lines) + b"\n"
+        
+        batch_file = await self.client.files.create(file=("antigone_batch.jsonl", batch_input), purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"Submitted batch {batch.id} with {len(prompts)} request(s)")
+        return batch.id
+    
+    async def wait_for_batch(self, batch_id: str, poll_interval: float = 60) -> Dict[str, str]:
+        """
+        Poll a Batch job until it finishes and download its results.
+        
+        Args:
+            batch_id: Id returned by submit_batch
+            poll_interval: Seconds between status checks
+            
+        Returns:
+            Mapping of custom_id -> response content for every successful request
+        """
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in ('completed', 'failed', 'expired', 'cancelled'):
+                break
+            counts = batch.request_counts
+            progress = f" ({counts.completed}/{counts.total} done)" if counts else ""
+            print(f"  Batch {batch_id}: {batch.status}{progress}")
+            await asyncio.sleep(poll_interval)
+        
+        if batch.status != 'completed':
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+        
+        responses = {}
+        if batch.output_file_id:
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.content.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                custom_id = record.get("custom_id")
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    error = record.get("error") or response.get("body", {}).get("error")
+                    print(f"  Batch request {custom_id} failed: {error}", file=sys.stderr)
+                    continue
+                responses[custom_id] = response["body"]["choices"][0]["message"]["content"].strip()
+        if batch.error_file_id:
+            print(f"  Batch {batch_id} reported errors (see file {batch.error_file_id})", file=sys.stderr)
+        return responses
+    
+    async def process_all_batch(self, model: str = "gpt-5.2", temperature: float = 0.3, max_tokens: int = 4000, skip_existing: bool = True, validate: bool = True, poll_interval: float = 60):
+        """
+        Process all verse ranges through the OpenAI Batch API (half the cost of direct calls,
+        results within the 24h completion window).
+        
+        Runs two batches: canonical triples first, then translation variants, since the
+        translation prompts embed the canonical TTL.
+        
+        Args:
+            model: OpenAI model to use
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            skip_existing: Skip if output files already exist
+            validate: Run validation on generated files
+            poll_interval: Seconds between batch status checks
+        """
+        verse_ranges = self.find_verse_ranges(skip_existing)
         
         if not verse_ranges:
             print("No verse ranges found!")
             return
         
         print(f"Found {len(verse_ranges)} verse range(s) to process")
+        if skip_existing:
+            verse_ranges = self._prune_done(verse_ranges)
         print()
         
+        self._read_all_texts(verse_ranges)
+        
+        # Stage 1: canonical triples (ancient_greek/output.ttl)
+        ranges_by_name = {vr.name: vr for vr in verse_ranges}
+        canonical_prompts = {}
         for verse_range in verse_ranges:
+            ancient_greek_path = verse_range.dir / 'ancient_greek' / 'output.ttl'
+            if ancient_greek_path.exists() and skip_existing:
+                continue
             try:
-                result = self.process_verse_range(verse_range, model, temperature, max_tokens, skip_existing, validate)
-                if result:
-                    paths_str = ", ".join(str(p) for p in result)
-                    print(f"  Completed: {paths_str}")
-                print()
+                canonical_prompts[verse_range.name] = self.build_canonical_prompt(verse_range)
             except Exception as e:
-                print(f"Failed to process {verse_range}: {str(e)}", file=sys.stderr)
-                print()
-                continue
+                print(f"Failed to prepare {verse_range}: {str(e)}", file=sys.stderr)
+        
+        if canonical_prompts:
+            print("Stage 1: canonical triples")
+            batch_id = await self.submit_batch(canonical_prompts, model, temperature, max_tokens)
+            responses = await self.wait_for_batch(batch_id, poll_interval)
+            for name, api_response in responses.items():
+                verse_range = ranges_by_name[name]
+                output_path = self.save_triples(verse_range, self.extract_triples(api_response), 'ancient_greek')
+                print(f"  [{verse_range}] Saved to: {output_path}")
+                if validate:
+                    self._validate_output(output_path)
+            print()
+        
+        # Stage 2: translation variants merged with canonical ({language}/output.ttl)
+        if self.prompt_template_path:
+            print("Processing complete!")
+            return
+        translation_prompts = {}
+        canonical_by_range = {}
+        for verse_range in verse_ranges:
+            ancient_greek_path = verse_range.dir / 'ancient_greek' / 'output.ttl'
+            if not ancient_greek_path.exists():
+                continue  # Canonical stage failed for this range
+            for lang, input_path in self.get_available_languages(verse_range).items():
+                if lang == 'ancient_greek':
+                    continue
+                trans_path = verse_range.dir / lang / 'output.ttl'
+                if trans_path.exists() and skip_existing:
+                    continue
+                if verse_range.name not in canonical_by_range:
+                    canonical_by_range[verse_range.name] = ancient_greek_path.read_text(encoding='utf-8')
+                trans_text = self.read_translation_text(verse_range, lang, input_path)
+                prompt = self.build_prompt(trans_text, self.translation_prompt_template, canonical_by_range[verse_range.name])
+                translation_prompts[f"{verse_range.name}:{lang}"] = prompt
+        
+        if translation_prompts:
+            print("Stage 2: translation triples")
+            batch_id = await self.submit_batch(translation_prompts, model, temperature, max_tokens)
+            responses = await self.wait_for_batch(batch_id, poll_interval)
+            for custom_id, api_response in responses.items():
+                name, lang = custom_id.split(':', 1)
+                verse_range = ranges_by_name[name]
+                translation_triples = self.extract_triples(api_response)
+                merged = self._merge_canonical_with_translations(canonical_by_range[name], translation_triples, name)
+                output_path = self.save_triples(verse_range, merged, lang)
+                print(f"  [{verse_range}] Saved to: {output_path}")
+                if validate:
+                    self._validate_output(output_path)
+            self._canonical_cache.clear()
+            print()
         
         print("Processing complete!")
 
@@ -571,7 +1685,7 @@ def main():
     parser.add_argument(
         '--no-skip-existing',
         action='store_true',
-        help='Overwrite existing output files'
+        help='Overwrite existing output files, calling the API again instead of reusing cached responses'
     )
     parser.add_argument(
         '--verse-range',
@@ -584,39 +1698,133 @@ def main():
         action='store_true',
         help='Skip validation of generated output files'
     )
+    parser.add_argument(
+        '--strict-merge',
+        action='store_true',
+        help='Merge canonical and translation triples through rdflib instead of the faster textual merge'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=str(LLM_CACHE_DIR),
+        help=f'Directory of the exact API response cache (default: {LLM_CACHE_DIR})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the API instead of reusing cached responses for identical requests'
+    )
+    parser.add_argument(
+        '--semantic-cache',
+        action='store_true',
+        help='Reuse triples of near-identical passages from .triple_cache/ instead of calling the API (requires numpy)'
+    )
+    parser.add_argument(
+        '--semantic-threshold',
+        type=float,
+        default=0.95,
+        help='Minimum cosine similarity for a semantic cache hit (default: 0.95)'
+    )
+    parser.add_argument(
+        '--rpm',
+        type=float,
+        default=500,
+        help='Requests per minute allowed by your OpenAI rate limit (default: 500)'
+    )
+    parser.add_argument(
+        '--tpm',
+        type=float,
+        default=500_000,
+        help='Tokens per minute allowed by your OpenAI rate limit (default: 500000)'
+    )
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=20,
+        help='Maximum number of verse ranges and API requests in flight at once (default: 20)'
+    )
+    parser.add_argument(
+        '--passages-per-request', '--batch-size',
+        dest='passages_per_request',
+        type=int,
+        default=1,
+        help='Pack up to N canonical passages into one request to save round trips and requests per minute (default: 1, no packing)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream API responses, stripping the code fence as chunks arrive'
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Submit all requests through the OpenAI Batch API (50%% cheaper, results within 24h)'
+    )
+    parser.add_argument(
+        '--batch-poll-interval',
+        type=float,
+        default=60,
+        help='Seconds between Batch API status checks (default: 60)'
+    )
     
     args = parser.parse_args()
     
+    async def run(processor: VerseRangeProcessor, verse_range: Optional[VerseRange]):
+        async with processor:
+            if verse_range is not None:
+                # Process single verse range
+                await processor.process_verse_range(
+                    verse_range,
+                    args.model,
+                    args.temperature,
+                    args.max_tokens,
+                    skip_existing=not args.no_skip_existing,
+                    validate=not args.no_validate
+                )
+            elif args.batch:
+                # Process all verse ranges through the Batch API
+                await processor.process_all_batch(
+                    args.model,
+                    args.temperature,
+                    args.max_tokens,
+                    skip_existing=not args.no_skip_existing,
+                    validate=not args.no_validate,
+                    poll_interval=args.batch_poll_interval
+                )
+            else:
+                # Process all verse ranges
+                await processor.process_all(
+                    args.model,
+                    args.temperature,
+                    args.max_tokens,
+                    skip_existing=not args.no_skip_existing,
+                    validate=not args.no_validate,
+                    passages_per_request=args.passages_per_request
+                )
+    
     try:
-        processor = VerseRangeProcessor(
-            args.productions_dir,
-            args.prompt_template,
-            args.canonical_prompt,
-            args.translation_prompt,
-            args.ontology,
-            args.demo,
-            args.api_key
+        processor_args = dict(
+            prompt_template_path=args.prompt_template,
+            canonical_prompt_path=args.canonical_prompt,
+            translation_prompt_path=args.translation_prompt,
+            ontology_path=args.ontology,
+            demo_path=args.demo,
+            api_key=args.api_key,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm,
+            semantic_cache=args.semantic_cache,
+            semantic_threshold=args.semantic_threshold,
+            strict_merge=args.strict_merge,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            # Regenerating outputs must not hand back the cached response that produced them
+            refresh_cache=args.no_skip_existing,
+            stream=args.stream
         )
-        
         if args.verse_range:
-            # Process single verse range
-            processor.process_verse_range(
-                args.verse_range,
-                args.model,
-                args.temperature,
-                args.max_tokens,
-                skip_existing=not args.no_skip_existing,
-                validate=not args.no_validate
-            )
+            processor, verse_range = VerseRangeProcessor.from_single(args.productions_dir, args.verse_range, **processor_args)
         else:
-            # Process all verse ranges
-            processor.process_all(
-                args.model,
-                args.temperature,
-                args.max_tokens,
-                skip_existing=not args.no_skip_existing,
-                validate=not args.no_validate
-            )
+            processor, verse_range = VerseRangeProcessor(args.productions_dir, **processor_args), None
+        asyncio.run(run(processor, verse_range))
     
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
@@ -18,8 +18,12 @@ fine-grained verse alignment (e.g., line 966 only), manual alignment with the Gr
 or English text would be needed.
 """
 
+import functools
+import os
 import re
+import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -53,34 +57,134 @@ CHINESE_SCENE_MARKERS = [
     (r"退\s*場", 1115, 1352),          # Fifth stasimon + Exodos
 ]
 
+# All scene markers as one alternation, so the text is scanned once rather than once per marker
+_SCENE_RE = re.compile("(" + "|".join(pattern for pattern, _, _ in CHINESE_SCENE_MARKERS) + ")")
+# Verse range of each marker keyed by its text with whitespace removed (e.g. "第一場")
+_SCENE_RANGES = {
+    re.sub(r"\\s\*", "", pattern).replace("\\", ""): (start_verse, end_verse)
+    for pattern, start_verse, end_verse in CHINESE_SCENE_MARKERS
+}
+# Verse ranges in marker order, for assigning split sections positionally
+_VERSE_RANGES = tuple(_SCENE_RANGES.values())
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Any CJK ideograph: used to check that a PDF has a usable Chinese text layer
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+# Pages probed for a text layer before the (slow) full pypdf extraction
+TEXT_LAYER_PROBE_PAGES = 3
+
+_PAGE_MARKER_RE = re.compile(r"\s*--\s*\d+\s+of\s+\d+\s+--\s*")
+_PAGE_NUMBER_RE = re.compile(r"^\s*\d+\s*$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _extract_with_pdftotext(pdf_path: Path) -> str | None:
+    """Extract text with Poppler's pdftotext, or None if it is not installed or fails."""
+    try:
+        result = subprocess.run(
+            ["pdftotext", "-enc", "UTF-8", str(pdf_path), "-"],
+            capture_output=True,
+            check=True,
+        )
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return None
+    # pdftotext ends every page with a form feed; use a newline like the other extractors
+    return result.stdout.decode("utf-8").replace("\f", "\n")
+
+
+def _extract_pages_with_pypdf(pdf_path: str, start: int, stop: int) -> list[str]:
+    """Extract the text of pages [start, stop) with a PdfReader of this process's own."""
+    from pypdf import PdfReader
+    
+    reader = PdfReader(pdf_path, strict=False)
+    # Empty pages are kept (as empty strings) so page breaks still separate paragraphs
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
 
 def extract_text_from_pdf(pdf_path: Path) -> str:
-    """Extract text from PDF using pypdf."""
+    """
+    Extract text from PDF, trying the fastest available extractor first:
+    pdftotext (Poppler), then PyMuPDF, then pypdf.
+    """
+    text = _extract_with_pdftotext(pdf_path)
+    if text is not None:
+        return text
+    
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf  # PyMuPDF < 1.24
+        except ImportError:
+            pymupdf = None
+    if pymupdf is not None:
+        with pymupdf.open(str(pdf_path)) as doc:
+            return "\n".join(page.get_text("text") for page in doc)
+    
     try:
         from pypdf import PdfReader
     except ImportError:
-        raise ImportError("pypdf is required. Install with: pip install pypdf")
+        raise ImportError("pypdf is required. Install with: pip install pypdf (or pip install pymupdf)")
     
-    reader = PdfReader(str(pdf_path))
-    text_parts = []
-    for page in reader.pages:
-        text_parts.append(page.extract_text() or "")
-    return "\n".join(text_parts)
+    # Lenient parsing: extraction does not need pypdf's strict validation
+    reader = PdfReader(str(pdf_path), strict=False)
+    num_pages = len(reader.pages)
+    # Fail fast on scanned or garbled PDFs, where pypdf can spend minutes producing nothing usable
+    probe = "".join(reader.pages[i].extract_text() or "" for i in range(min(TEXT_LAYER_PROBE_PAGES, num_pages)))
+    if not _CJK_RE.search(probe):
+        raise ValueError(
+            f"No Chinese text found on the first {TEXT_LAYER_PROBE_PAGES} pages of {pdf_path}; "
+            "the PDF may lack a text layer. Try installing pdftotext (Poppler) or PyMuPDF, "
+            "or pass an extracted .txt file instead."
+        )
+    workers = min(os.cpu_count() or 1, num_pages // 8)
+    if workers > 1:
+        # pypdf extraction is CPU-bound Python and a PdfReader shares one file stream, so
+        # parallelize across processes, each reading its own contiguous block of pages
+        step = -(-num_pages // workers)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                blocks = pool.map(
+                    _extract_pages_with_pypdf,
+                    [str(pdf_path)] * workers,
+                    range(0, num_pages, step),
+                    [min(start + step, num_pages) for start in range(0, num_pages, step)],
+                )
+                return "\n".join(text for block in blocks for text in block)
+        except Exception as e:
+            print(f"Parallel extraction failed ({e}), extracting pages serially")
+    # Empty pages are kept (as empty strings) so page breaks still separate paragraphs
+    return "\n".join([page.extract_text() or "" for page in reader.pages])
 
 
 def extract_text_from_txt(txt_path: Path) -> str:
     """Read text from a plain text file."""
-    return txt_path.read_text(encoding="utf-8")
+    # One-shot decode of the raw bytes rather than an incremental text wrapper
+    text = txt_path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        # Same newline translation read_text does (e.g. files saved on Windows)
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
+@functools.lru_cache(maxsize=1)
 def clean_text(text: str) -> str:
-    """Remove page markers and normalize whitespace."""
+    """
+    Remove page markers and normalize whitespace.
+    The last result is cached, so calling both split functions on the same text cleans it once.
+    """
+    # Form feeds (page breaks in text extracted by older runs with pdftotext) become newlines
+    if "\f" in text:
+        text = text.replace("\f", "\n")
     # Remove " - N of 24 - " style page markers
-    text = re.sub(r"\s*--\s*\d+\s+of\s+\d+\s+--\s*", "\n\n", text)
+    # (the substring checks skip a full regex scan when a pattern cannot match)
+    if "--" in text:
+        text = _PAGE_MARKER_RE.sub("\n\n", text)
     # Remove standalone page numbers
-    text = re.sub(r"^\s*\d+\s*$", "", text, flags=re.MULTILINE)
+    text = _PAGE_NUMBER_RE.sub("", text)
     # Normalize multiple newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if "\n\n\n" in text:
+        text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -91,15 +195,18 @@ def split_by_scenes(text: str) -> list[tuple[int, int, str]]:
     text = clean_text(text)
     results = []
     
-    # Find all scene marker positions
+    # Find all scene marker positions in a single pass (matches come out in position order)
     positions = []
-    for pattern, start_verse, end_verse in CHINESE_SCENE_MARKERS:
-        for m in re.finditer(pattern, text):
-            positions.append((m.start(), m.end(), start_verse, end_verse, m.group(0)))
-            break  # First match only per pattern
-    
-    # Sort by position
-    positions.sort(key=lambda x: x[0])
+    seen = set()
+    for m in _SCENE_RE.finditer(text):
+        key = _WHITESPACE_RE.sub("", m.group(0))
+        if key in seen:
+            continue  # First match only per marker
+        seen.add(key)
+        start_verse, end_verse = _SCENE_RANGES[key]
+        positions.append((m.start(), m.end(), start_verse, end_verse, m.group(0)))
+        if len(seen) == len(_SCENE_RANGES):
+            break  # Every marker found; no need to scan the rest of the text
     
     # Extract content between markers
     for i, (pos_start, pos_end, start_verse, end_verse, marker) in enumerate(positions):
@@ -121,28 +228,21 @@ def split_simple_by_verse_ranges(text: str) -> list[tuple[int, int, str]]:
     Used when we can't do fine-grained alignment.
     """
     text = clean_text(text)
-    results = []
     
-    # Split at each 場 marker
-    parts = re.split(
-        r"(開\s*場\s*\[1\]|第\s*一\s*場|第\s*二\s*場|第\s*三\s*場|第\s*四\s*場|第\s*五\s*場|退\s*場)",
-        text,
-    )
+    # Split at each 場 marker, stopping after the last verse range's marker (the rest of the
+    # text belongs to that section)
+    parts = _SCENE_RE.split(text, maxsplit=len(_VERSE_RANGES))
+    # One capturing group: front matter followed by (marker, content) pairs
+    assert len(parts) % 2 == 1
     
     # parts[0] = front matter (characters, etc.), parts[1] = first marker, parts[2] = first content, ...
-    verse_ranges = [(1, 99), (100, 331), (332, 581), (582, 780), (781, 943), (944, 1114), (1115, 1352)]
-    idx = 0
-    i = 1
-    while i < len(parts) and idx < len(verse_ranges):
-        marker = parts[i]
-        content = (parts[i + 1] if i + 1 < len(parts) else "").strip()
-        start, end = verse_ranges[idx]
-        full_content = marker + "\n" + content if content else marker
-        results.append((start, end, full_content))
-        idx += 1
-        i += 2
-    
-    return results
+    # The n-th marker found gets the n-th verse range; zip stops at whichever runs out first
+    markers = parts[1::2]
+    contents = [content.strip() for content in parts[2::2]]
+    return [
+        (start, end, marker + "\n" + content if content else marker)
+        for (start, end), marker, content in zip(_VERSE_RANGES, markers, contents)
+    ]
 
 
 def write_output(
@@ -152,25 +252,36 @@ def write_output(
     """Write verse range files to output directory."""
     output_dir = Path(output_dir)
     
-    for start_verse, end_verse, content in sections:
+    # Each section is encoded once and the bytes reused for the full-play file
+    encoded = [(start_verse, end_verse, content.encode("utf-8")) for start_verse, end_verse, content in sections]
+    tasks = []
+    for start_verse, end_verse, data in encoded:
         verse_range_name = f"verse_{start_verse}_to_{end_verse}"
-        verse_dir = output_dir / verse_range_name / "chinese"
-        verse_dir.mkdir(parents=True, exist_ok=True)
-        
         filename = f"aZH_{start_verse}_to_{end_verse}.txt"
-        filepath = verse_dir / filename
-        filepath.write_text(content, encoding="utf-8")
-        print(f"  Wrote {filepath.relative_to(output_dir)}")
-    
+        tasks.append((output_dir / verse_range_name / "chinese" / filename, data))
     # Also write full play as verse_1_to_1352
-    full_content = "\n\n".join(
-        f"=== Verses {s}-{e} ===\n{c}" for s, e, c in sections
-    )
-    verse_dir = output_dir / "verse_1_to_1352" / "chinese"
-    verse_dir.mkdir(parents=True, exist_ok=True)
-    filepath = verse_dir / "aZH_1_to_1352.txt"
-    filepath.write_text(full_content, encoding="utf-8")
-    print(f"  Wrote {filepath.relative_to(output_dir)} (full play)")
+    full_path = output_dir / "verse_1_to_1352" / "chinese" / "aZH_1_to_1352.txt"
+    
+    def write_full_play():
+        # Streamed section by section instead of building a second copy of the play in memory
+        with full_path.open("wb", buffering=1 << 20) as f:
+            for i, (s, e, data) in enumerate(encoded):
+                if i:
+                    f.write(b"\n\n")
+                f.write(f"=== Verses {s}-{e} ===\n".encode("utf-8"))
+                f.write(data)
+    
+    for verse_dir in {filepath.parent for filepath, _ in tasks} | {full_path.parent}:
+        verse_dir.mkdir(parents=True, exist_ok=True)
+    # The files are independent, so overlap their writes
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        full_play = pool.submit(write_full_play)
+        list(pool.map(lambda task: task[0].write_bytes(task[1]), tasks))
+        full_play.result()
+    
+    for filepath, _ in tasks:
+        print(f"  Wrote {filepath.relative_to(output_dir)}")
+    print(f"  Wrote {full_path.relative_to(output_dir)} (full play)")
 
 
 def main():
@@ -191,7 +302,18 @@ def main():
     print(f"Reading: {input_path}")
     
     if input_path.suffix.lower() == ".pdf":
-        text = extract_text_from_pdf(input_path)
+        # Extracted text is cached next to the PDF and reused until the PDF changes
+        cache_path = input_path.with_suffix(input_path.suffix + ".txt")
+        if cache_path.exists() and cache_path.stat().st_mtime >= input_path.stat().st_mtime:
+            print(f"Using cached text: {cache_path}")
+            text = extract_text_from_txt(cache_path)
+        else:
+            try:
+                text = extract_text_from_pdf(input_path)
+            except ValueError as e:
+                print(f"Error: {e}")
+                sys.exit(2)
+            cache_path.write_text(text, encoding="utf-8")
     else:
         text = extract_text_from_txt(input_path)
     
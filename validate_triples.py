@@ -9,16 +9,169 @@ Validates generated triple files against the ontology constraints:
 - Correct prefix usage
 """
 
+import functools
+import os
+import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from rdflib import Graph, URIRef, Namespace
 from rdflib.namespace import RDF, RDFS, OWL, XSD
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 
 # Namespace
 ANTIGONE = Namespace("http://example.org/antigone#")
 
+# Common character and concept names in Antigone, matched as whole words in conflict descriptions
+KNOWN_ENTITIES = frozenset({
+    'antigone', 'creon', 'ismene', 'haemon', 'teiresias', 'chorus',
+    'polyneices', 'eteocles', 'oedipus', 'jocasta',
+    'eros', 'desire', 'justice', 'law', 'fate', 'gods', 'divine',
+    'miasma', 'bloodguilt', 'polis', 'city'
+})
+_ENTITY_RE = re.compile(r'\b(?:' + '|'.join(sorted(KNOWN_ENTITIES, key=len, reverse=True)) + r')\b', re.IGNORECASE)
+
+# Ontology classes an individual is expected to have (see validate_file)...
+RECOGNIZED_TYPES = frozenset({
+    ANTIGONE.Character, ANTIGONE.Motivation, ANTIGONE.Emotion, ANTIGONE.Theme,
+    ANTIGONE.Conflict, ANTIGONE.MoralDecision, ANTIGONE.EthicalPrinciple
+})
+# ...or at least a generic OWL type
+FALLBACK_TYPES = frozenset({OWL.NamedIndividual, OWL.Thing})
+
+# Types of an untyped individual
+NO_TYPES: frozenset = frozenset()
+
+# GraphIndex.char_flags bits: the relationships a Character is expected to have...
+RELATIONSHIP_FLAGS = {
+    ANTIGONE.hasMotivation: 1,
+    ANTIGONE.makesMoralDecision: 2,
+    ANTIGONE.experiencesEmotion: 4,
+    ANTIGONE.advocatesFor: 8,
+}
+# ...and any relationship at all (a predicate other than rdf:type and :description)
+ANY_RELATIONSHIP = 16
+
+
+@dataclass
+class GraphIndex:
+    """What the validation checks need from a graph, collected in a single pass over its triples."""
+    types_by_subject: Dict[URIRef, frozenset] = field(default_factory=dict)
+    conflicts: Dict[URIRef, List[URIRef]] = field(default_factory=lambda: defaultdict(list))
+    conflict_descriptions: Dict[URIRef, str] = field(default_factory=dict)
+    char_flags: Dict[URIRef, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class _LazyMessage:
+    """An error message formatted only when it is first converted to str (e.g. printed)."""
+    __slots__ = ('_format', '_args', '_text')
+    
+    def __init__(self, format_func, *args):
+        self._format = format_func
+        self._args = args
+        self._text = None
+    
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._format(*self._args)
+            self._format = self._args = None
+        return self._text
+    
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+def _format_constraint_violation(constraint: str, role: str, predicate: URIRef, allowed: frozenset,
+                                 node: URIRef, node_types: frozenset, namespace_manager) -> str:
+    """Message for a domain ('subject') or range ('object') violation."""
+    return (
+        f"{constraint.capitalize()} violation: {predicate.n3(namespace_manager)} "
+        f"requires {constraint} {sorted(str(a) for a in allowed)}, "
+        f"but {role} {node.n3(namespace_manager)} has types {[str(t) for t in node_types]}"
+    )
+
+
+def _local_name(uri: URIRef) -> str:
+    """Return the part of a URI after its last '#' (or, failing that, its last '/')."""
+    uri_str = str(uri)
+    return uri_str.rpartition('#' if '#' in uri_str else '/')[2]
+
+
+def _split_local_name(uri: URIRef) -> Tuple[str, Optional[str], str, str, int]:
+    """Split a local name such as "Antigone_Character_Antigone" on underscores.
+    
+    Returns:
+        (first part, second part or None, last part, everything before the last part, number of parts)
+    """
+    local_name = _local_name(uri)
+    parts = local_name.split('_')
+    count = len(parts)
+    return parts[0], parts[1] if count > 1 else None, parts[-1], local_name.rpartition('_')[0], count
+
+
+def _extract_constraints(ontology: Graph) -> Tuple[Dict[URIRef, frozenset], Dict[URIRef, frozenset]]:
+    """
+    Extract property domain/range constraints from ontology.
+    A domain or range that includes owl:Thing allows anything, so it is left out and
+    triples using that property are never checked against it.
+    """
+    property_domains = {}
+    property_ranges = {}
+    
+    # Extract all object properties and their domains/ranges
+    for prop in ontology.subjects(RDF.type, OWL.ObjectProperty):
+        prop_uri = URIRef(prop)
+        
+        # Get domain
+        domains = list(ontology.objects(prop_uri, RDFS.domain))
+        if domains:
+            # Handle union classes
+            domain_list = []
+            for domain in domains:
+                union_members = list(ontology.objects(domain, OWL.unionOf))
+                if union_members:
+                    # It's a union - extract members
+                    for member in ontology.items(union_members[0]):
+                        domain_list.append(member)
+                else:
+                    domain_list.append(domain)
+            if OWL.Thing not in domain_list:
+                property_domains[prop_uri] = frozenset(domain_list)
+        
+        # Get range
+        ranges = list(ontology.objects(prop_uri, RDFS.range))
+        if ranges:
+            range_list = []
+            for range_val in ranges:
+                union_members = list(ontology.objects(range_val, OWL.unionOf))
+                if union_members:
+                    # It's a union - extract members
+                    for member in ontology.items(union_members[0]):
+                        range_list.append(member)
+                else:
+                    range_list.append(range_val)
+            if OWL.Thing not in range_list:
+                property_ranges[prop_uri] = frozenset(range_list)
+    
+    return property_domains, property_ranges
+
+
+@functools.lru_cache(maxsize=None)
+def _load_ontology(path: str, mtime_ns: int) -> Tuple[Graph, Dict[URIRef, frozenset], Dict[URIRef, frozenset]]:
+    """
+    Parse an ontology and extract its constraints, once per process for each version of
+    the file (mtime_ns is part of the cache key, so an edited ontology is reparsed).
+    
+    Returns:
+        Tuple of (ontology graph, property domains, property ranges), shared by every
+        validator using this ontology and not to be modified
+    """
+    ontology = Graph()
+    ontology.parse(path, format="turtle")
+    return (ontology, *_extract_constraints(ontology))
+
 
 class TripleValidator:
     """Validates RDF triples against ontology constraints."""
@@ -31,158 +184,115 @@ class TripleValidator:
             ontology_path: Path to the ontology file
         """
         self.ontology_path = Path(ontology_path)
-        self.ontology = Graph()
         self.errors = []
         self.warnings = []
+        # Keys of the messages already reported for the current file (see _error/_warn)
+        self._error_keys = set()
+        self._warning_keys = set()
         
         # Load ontology
         if not self.ontology_path.exists():
             raise FileNotFoundError(f"Ontology file not found: {self.ontology_path}")
         
-        self.ontology.parse(str(self.ontology_path), format="turtle")
-        self._extract_constraints()
+        self.ontology, self.property_domains, self.property_ranges = _load_ontology(
+            str(self.ontology_path.resolve()), self.ontology_path.stat().st_mtime_ns
+        )
+        # Predicates with a domain or range constraint; the only ones _check_property_constraint needs to see
+        self.constrained_predicates = frozenset(self.property_domains.keys() | self.property_ranges.keys())
     
-    def _extract_constraints(self):
-        """Extract property domain/range constraints from ontology."""
-        self.property_domains = {}
-        self.property_ranges = {}
-        
-        # Extract all object properties and their domains/ranges
-        for prop in self.ontology.subjects(RDF.type, OWL.ObjectProperty):
-            prop_uri = URIRef(prop)
-            
-            # Get domain
-            domains = list(self.ontology.objects(prop_uri, RDFS.domain))
-            if domains:
-                # Handle union classes
-                domain_list = []
-                for domain in domains:
-                    union_members = list(self.ontology.objects(domain, OWL.unionOf))
-                    if union_members:
-                        # It's a union - extract members
-                        for member in self.ontology.items(union_members[0]):
-                            domain_list.append(member)
-                    else:
-                        domain_list.append(domain)
-                self.property_domains[prop_uri] = domain_list
-            
-            # Get range
-            ranges = list(self.ontology.objects(prop_uri, RDFS.range))
-            if ranges:
-                range_list = []
-                for range_val in ranges:
-                    union_members = list(self.ontology.objects(range_val, OWL.unionOf))
-                    if union_members:
-                        # It's a union - extract members
-                        for member in self.ontology.items(union_members[0]):
-                            range_list.append(member)
-                    else:
-                        range_list.append(range_val)
-                self.property_ranges[prop_uri] = range_list
+    def _error(self, message, key=None):
+        """Record an error once per file; key (default: the message itself) identifies duplicates."""
+        key = message if key is None else key
+        if key not in self._error_keys:
+            self._error_keys.add(key)
+            self.errors.append(message)
     
-    def _get_individual_types(self, graph: Graph, individual: URIRef) -> Set[URIRef]:
-        """Get all types of an individual."""
-        types = set()
-        for obj in graph.objects(individual, RDF.type):
-            types.add(obj)
-        return types
+    def _warn(self, message: str, key=None):
+        """Record a warning once per file; key (default: the message itself) identifies duplicates."""
+        key = message if key is None else key
+        if key not in self._warning_keys:
+            self._warning_keys.add(key)
+            self.warnings.append(message)
     
-    def _check_property_constraint(self, graph: Graph, subject: URIRef, predicate: URIRef, object_val: URIRef):
+    def _index_graph(self, graph: Graph) -> GraphIndex:
+        """Collect types, conflicts, descriptions and relationship flags in one pass over the graph."""
+        index = GraphIndex()
+        # defaultdict rather than setdefault(subject, set()), which builds a throwaway set per triple
+        types_by_subject = defaultdict(set)
+        # Hoisted out of the loop, which runs once per triple
+        rdf_type = RDF.type
+        description = ANTIGONE.description
+        conflict_between = ANTIGONE.conflictBetween
+        relationship_flag = RELATIONSHIP_FLAGS.get
+        conflict_descriptions = index.conflict_descriptions
+        conflicts = index.conflicts
+        char_flags = index.char_flags
+        for subject, predicate, object_val in graph:
+            if predicate == rdf_type:
+                types_by_subject[subject].add(object_val)
+                continue
+            if predicate == description:
+                conflict_descriptions[subject] = str(object_val)
+                continue
+            if predicate == conflict_between:
+                conflicts[subject].append(object_val)
+            char_flags[subject] |= relationship_flag(predicate, 0) | ANY_RELATIONSHIP
+        index.types_by_subject = {subject: frozenset(types) for subject, types in types_by_subject.items()}
+        return index
+    
+    def _check_property_constraint(self, graph: Graph, subject: URIRef, predicate: URIRef, object_val: URIRef,
+                                   types_by_subject: Dict[URIRef, frozenset]):
         """Check if a triple violates domain/range constraints."""
-        predicate_uri = URIRef(predicate)
-        
         # Check domain
-        if predicate_uri in self.property_domains:
-            subject_types = self._get_individual_types(graph, subject)
-            allowed_domains = self.property_domains[predicate_uri]
+        allowed_domains = self.property_domains.get(predicate)
+        if allowed_domains is not None:
+            subject_types = types_by_subject.get(subject, NO_TYPES)
             
             # Check if subject type matches any allowed domain
-            domain_match = False
-            for domain in allowed_domains:
-                if domain in subject_types or domain == OWL.Thing:
-                    domain_match = True
-                    break
+            domain_match = not allowed_domains.isdisjoint(subject_types)
             
             if not domain_match and subject_types:
-                self.errors.append(
-                    f"Domain violation: {predicate.n3(graph.namespace_manager)} "
-                    f"requires domain {[str(d) for d in allowed_domains]}, "
-                    f"but subject {subject.n3(graph.namespace_manager)} has types {[str(t) for t in subject_types]}"
-                )
+                # Formatted only if the message is printed; counting errors does not pay for n3()
+                self._error(_LazyMessage(
+                    _format_constraint_violation, 'domain', 'subject', predicate, allowed_domains,
+                    subject, subject_types, graph.namespace_manager
+                ), key=('domain', predicate, subject))
         
         # Check range
-        if predicate_uri in self.property_ranges:
-            object_types = self._get_individual_types(graph, object_val)
-            allowed_ranges = self.property_ranges[predicate_uri]
+        allowed_ranges = self.property_ranges.get(predicate)
+        if allowed_ranges is not None:
+            object_types = types_by_subject.get(object_val, NO_TYPES)
             
             # Check if object type matches any allowed range
-            range_match = False
-            for range_val in allowed_ranges:
-                if range_val in object_types or range_val == OWL.Thing:
-                    range_match = True
-                    break
+            range_match = not allowed_ranges.isdisjoint(object_types)
             
             if not range_match and object_types:
-                self.errors.append(
-                    f"Range violation: {predicate.n3(graph.namespace_manager)} "
-                    f"requires range {[str(r) for r in allowed_ranges]}, "
-                    f"but object {object_val.n3(graph.namespace_manager)} has types {[str(t) for t in object_types]}"
-                )
+                self._error(_LazyMessage(
+                    _format_constraint_violation, 'range', 'object', predicate, allowed_ranges,
+                    object_val, object_types, graph.namespace_manager
+                ), key=('range', predicate, object_val))
     
     def _extract_entity_names_from_text(self, text: str) -> Set[str]:
-        """Extract potential entity names from description text."""
-        import re
-        # Common character and concept names in Antigone
-        known_entities = {
-            'antigone', 'creon', 'ismene', 'haemon', 'teiresias', 'chorus',
-            'polyneices', 'eteocles', 'oedipus', 'jocasta',
-            'eros', 'desire', 'justice', 'law', 'fate', 'gods', 'divine',
-            'miasma', 'bloodguilt', 'polis', 'city'
-        }
-        
-        text_lower = text.lower()
-        found_entities = set()
-        
-        # Check for known entities
-        for entity in known_entities:
-            if entity in text_lower:
-                found_entities.add(entity)
-        
-        # Extract capitalized words that might be entities
-        capitalized_words = re.findall(r'\b[A-Z][a-z]+\b', text)
-        for word in capitalized_words:
-            if word.lower() in known_entities:
-                found_entities.add(word.lower())
-        
-        return found_entities
+        """Extract potential entity names (KNOWN_ENTITIES) from description text."""
+        return {match.lower() for match in _ENTITY_RE.findall(text)}
     
     def _get_individual_local_name(self, uri: URIRef) -> str:
         """Extract local name from URI."""
-        uri_str = str(uri)
-        if '#' in uri_str:
-            return uri_str.split('#')[-1]
-        elif '/' in uri_str:
-            return uri_str.split('/')[-1]
-        return uri_str
+        return _local_name(uri)
     
-    def _check_semantic_issues(self, graph: Graph):
+    def _check_semantic_issues(self, graph: Graph, index: GraphIndex):
         """Check for semantic/logical issues in the triples."""
-        # Get all individuals and their types
-        individuals = {}
-        for subject, predicate, object_val in graph:
-            if predicate == RDF.type:
-                if subject not in individuals:
-                    individuals[subject] = set()
-                individuals[subject].add(object_val)
+        # All individuals and their types
+        individuals = index.types_by_subject
+        # Local names are split once per individual and shared by the checks below
+        name_parts = {individual: _split_local_name(individual) for individual in individuals}
         
         # Build a map of entity names to URIs for conflict checking
         entity_name_map = {}
-        for individual, types in individuals.items():
-            local_name = self._get_individual_local_name(individual)
+        for individual, (_, _, last, _, count) in name_parts.items():
             # Extract base name (e.g., "Antigone_Character_Antigone" -> "Antigone")
-            parts = local_name.split('_')
-            if len(parts) >= 3:
-                base_name = parts[-1].lower()
+            if count >= 3:
+                base_name = last.lower()
                 if base_name not in entity_name_map:
                     entity_name_map[base_name] = []
                 entity_name_map[base_name].append(individual)
@@ -191,11 +301,10 @@ class TripleValidator:
         character_names = {}
         for individual, types in individuals.items():
             if ANTIGONE.Character in types:
-                local_name = self._get_individual_local_name(individual)
-                parts = local_name.split('_')
-                if len(parts) >= 3 and parts[1] == 'Character':
-                    character_name = parts[0]
-                    identifier_name = parts[-1] if len(parts) > 2 else None
+                first, subtype, last, _, count = name_parts[individual]
+                if count >= 3 and subtype == 'Character':
+                    character_name = first
+                    identifier_name = last
                     
                     # Check for contradictions like "Antigone_Character_Chorus"
                     if identifier_name and character_name != identifier_name:
@@ -203,7 +312,7 @@ class TripleValidator:
                         common_names = ['chorus', 'creon', 'ismene', 'haemon', 'teiresias', 'antigone', 'polyneices', 'eteocles']
                         if identifier_name.lower() in common_names and \
                            character_name.lower() != identifier_name.lower():
-                            self.warnings.append(
+                            self._warn(
                                 f"Potential naming inconsistency: {individual.n3(graph.namespace_manager)} "
                                 f"has character name '{character_name}' but identifier suggests '{identifier_name}'"
                             )
@@ -214,62 +323,49 @@ class TripleValidator:
                     character_names[character_name].append(individual)
         
         # Check for inconsistent naming patterns across all entity types
-        naming_patterns = defaultdict(list)
-        for individual, types in individuals.items():
-            local_name = self._get_individual_local_name(individual)
-            parts = local_name.split('_')
-            if len(parts) >= 2:
+        # Per pattern only [capitalized names, names] is needed, not the individuals themselves
+        naming_patterns = defaultdict(lambda: [0, 0])
+        for _, _, last, stem, count in name_parts.values():
+            if count >= 2:
                 # Pattern: Type_Subtype_Name or Type_Name
-                pattern_key = '_'.join(parts[:-1]) if len(parts) > 2 else parts[0]
-                naming_patterns[pattern_key].append((individual, parts[-1]))
+                counts = naming_patterns[stem]
+                counts[0] += last[:1].isupper()
+                counts[1] += 1
         
         # Check for inconsistent naming within same pattern
-        for pattern, entities in naming_patterns.items():
-            if len(entities) > 1:
-                names = [name for _, name in entities]
+        for pattern, (capitalized, total) in naming_patterns.items():
+            if total > 1:
                 # Check if names follow consistent capitalization
-                capitalized = sum(1 for name in names if name and name[0].isupper())
-                if capitalized > 0 and capitalized < len(names):
-                    self.warnings.append(
+                if capitalized > 0 and capitalized < total:
+                    self._warn(
                         f"Inconsistent capitalization in naming pattern '{pattern}': "
                         f"some entities use capitalized names, others don't"
                     )
         
         # Check conflicts for semantic issues
-        conflicts = {}
-        conflict_descriptions = {}
-        for subject, predicate, object_val in graph:
-            if predicate == ANTIGONE.conflictBetween:
-                conflict_uri = subject
-                participant = object_val
-                if conflict_uri not in conflicts:
-                    conflicts[conflict_uri] = []
-                conflicts[conflict_uri].append(participant)
-            elif predicate == ANTIGONE.description:
-                conflict_descriptions[subject] = str(object_val)
+        conflicts = index.conflicts
+        conflict_descriptions = index.conflict_descriptions
         
         # Check for conflicts with insufficient participants and missing entities in descriptions
         for conflict_uri, participants in conflicts.items():
             if len(participants) < 2:
-                self.warnings.append(
+                self._warn(
                     f"Conflict {conflict_uri.n3(graph.namespace_manager)} has only {len(participants)} participant(s). "
                     f"Conflicts typically involve at least two opposing entities."
                 )
             
-            # Check if description mentions entities not listed as participants
-            if conflict_uri in conflict_descriptions:
+            # Check if description mentions entities not listed as participants (only reported
+            # for conflicts with fewer than two participants, so skip the text scan otherwise)
+            if len(participants) < 2 and conflict_uri in conflict_descriptions:
                 description = conflict_descriptions[conflict_uri]
                 mentioned_entities = self._extract_entity_names_from_text(description)
                 
                 # Get participant names
                 participant_names = set()
                 for participant in participants:
-                    local_name = self._get_individual_local_name(participant)
-                    parts = local_name.split('_')
-                    if len(parts) >= 3:
-                        participant_names.add(parts[-1].lower())
-                    elif len(parts) >= 2:
-                        participant_names.add(parts[-1].lower())
+                    _, _, last, _, count = name_parts.get(participant) or _split_local_name(participant)
+                    if count >= 2:
+                        participant_names.add(last.lower())
                 
                 # Check for mentioned entities that aren't participants
                 missing_entities = []
@@ -283,8 +379,8 @@ class TripleValidator:
                     if not found:
                         missing_entities.append(entity)
                 
-                if missing_entities and len(participants) < 2:
-                    self.warnings.append(
+                if missing_entities:
+                    self._warn(
                         f"Conflict {conflict_uri.n3(graph.namespace_manager)} description mentions "
                         f"'{', '.join(missing_entities)}' but these entities are not listed as participants. "
                         f"Consider adding them if they represent opposing forces."
@@ -293,25 +389,13 @@ class TripleValidator:
         # Check for missing relationships - Characters should typically have motivations, decisions, or emotions
         for individual, types in individuals.items():
             if ANTIGONE.Character in types:
-                has_motivation = any(graph.objects(individual, ANTIGONE.hasMotivation))
-                has_decision = any(graph.objects(individual, ANTIGONE.makesMoralDecision))
-                has_emotion = any(graph.objects(individual, ANTIGONE.experiencesEmotion))
-                has_advocacy = any(graph.objects(individual, ANTIGONE.advocatesFor))
-                
-                # Characters that appear but have no relationships might be incomplete
-                if not (has_motivation or has_decision or has_emotion or has_advocacy):
-                    # Check if character appears in any other relationships
-                    has_any_relationship = False
-                    for pred, obj in graph.predicate_objects(individual):
-                        if pred not in [RDF.type, ANTIGONE.description]:
-                            has_any_relationship = True
-                            break
-                    
-                    if not has_any_relationship:
-                        self.warnings.append(
-                            f"Character {individual.n3(graph.namespace_manager)} has no motivations, decisions, "
-                            f"emotions, or advocacy relationships. Consider adding relevant relationships."
-                        )
+                # Characters that appear but have no relationships (motivation, decision, emotion,
+                # advocacy or any other) might be incomplete
+                if not index.char_flags.get(individual, 0) & ANY_RELATIONSHIP:
+                    self._warn(
+                        f"Character {individual.n3(graph.namespace_manager)} has no motivations, decisions, "
+                        f"emotions, or advocacy relationships. Consider adding relevant relationships."
+                    )
         
         # Check for duplicate characters with different names
         character_by_role = {}
@@ -329,20 +413,18 @@ class TripleValidator:
             if len(chars) > 1:
                 # Multiple characters with same role - might be intentional (e.g., multiple guards)
                 # but worth checking if they have different names
-                char_names = [str(c).split('_')[0] for c in chars]
-                if len(set(char_names)) > 1:
-                    self.warnings.append(
+                char_names = {name_parts[c][0] for c in chars}
+                if len(char_names) > 1:
+                    self._warn(
                         f"Multiple characters with role '{role}' but different names: {[c.n3(graph.namespace_manager) for c in chars]}"
                     )
     
-    def _check_incomplete_greek_text(self, graph: Graph):
+    def _check_incomplete_greek_text(self, graph: Graph, index: GraphIndex):
         """Check for incomplete Greek text fragments in Line individuals."""
-        import re
-        
         # Get all Line individuals and their text
         line_texts = {}
-        for subject, predicate, object_val in graph:
-            if predicate == ANTIGONE.text and ANTIGONE.Line in self._get_individual_types(graph, subject):
+        for subject, _, object_val in graph.triples((None, ANTIGONE.text, None)):
+            if ANTIGONE.Line in index.types_by_subject.get(subject, NO_TYPES):
                 text_value = str(object_val)
                 line_texts[subject] = text_value
         
@@ -354,7 +436,7 @@ class TripleValidator:
             
             # Check 1: Lines ending with hyphens (indicating word breaks)
             if text_clean.endswith('-') or text_clean.endswith('—'):
-                self.errors.append(
+                self._error(
                     f"Incomplete Greek text: {line_uri.n3(graph.namespace_manager)} ends with a hyphen, "
                     f"indicating a word break. The line should be reconstructed from fragments. "
                     f"Text: \"{text[:100]}...\""
@@ -371,7 +453,7 @@ class TripleValidator:
                     # Check if it looks like a fragment (common fragment patterns)
                     fragment_patterns = ['πων', 'ζει', 'φείοις', 'τ\'', 'δ\'', 'μ\'', 'σ\'', 'ν\'', 'γ\'', 'θ\'']
                     if any(pattern in first_word for pattern in fragment_patterns):
-                        self.errors.append(
+                        self._error(
                             f"Incomplete Greek text: {line_uri.n3(graph.namespace_manager)} appears to start mid-word/fragment. "
                             f"The line should include the complete verse from the beginning. "
                             f"Text: \"{text[:100]}...\""
@@ -383,7 +465,7 @@ class TripleValidator:
             greek_text_length = sum(len(word) for word in greek_chars)
             
             if greek_text_length < 10 and greek_text_length > 0:
-                self.warnings.append(
+                self._warn(
                     f"Very short Greek text: {line_uri.n3(graph.namespace_manager)} contains only {greek_text_length} Greek characters. "
                     f"This might indicate an incomplete extraction. Text: \"{text[:100]}...\""
                 )
@@ -394,34 +476,33 @@ class TripleValidator:
                 last_char = text_clean[-1]
                 has_greek = bool(re.search(r'[α-ωΑ-Ω]', text_clean))
                 if has_greek and last_char == ',':
-                    self.warnings.append(
+                    self._warn(
                         f"Possibly incomplete Greek: {line_uri.n3(graph.namespace_manager)} ends with comma; "
                         f"verse may continue. Check source. Text: \"{text[:80]}...\""
                     )
                 elif has_greek and last_char not in '·.;:!?)':
                     # Ends with Greek letter (not punctuation) - may be mid-verse
                     if text_clean.endswith(('τ\'', 'δ\'', 'μ\'', 'σ\'', 'ν\'')):
-                        self.errors.append(
+                        self._error(
                             f"Incomplete Greek text: {line_uri.n3(graph.namespace_manager)} appears to end mid-phrase. "
                             f"The line should include the complete verse. Text: \"{text[:80]}...\""
                         )
                     elif len(text_clean) > 15:  # Substantial text ending without punctuation
-                        self.warnings.append(
+                        self._warn(
                             f"Possibly incomplete Greek text: {line_uri.n3(graph.namespace_manager)} ends without "
                             f"sentence punctuation (·.;:!?). Verse may wrap to next line. Text: \"{text[:80]}...\""
                         )
     
-    def _check_speech_contains_line_coverage(self, graph: Graph):
+    def _check_speech_contains_line_coverage(self, graph: Graph, index: GraphIndex):
         """Check that Speech individuals contain all Lines within their stated range."""
-        import re
         # Pattern: Speech_Character_START_END or Speech_Chorus_START_END
         speech_pattern = re.compile(r'^Speech_[A-Za-z]+_(\d+)_(\d+)$')
         line_pattern = re.compile(r'^Line_(\d+)$')
         
         # Build map: line_number -> line_uri
         line_numbers = {}
-        for subject, predicate, object_val in graph:
-            if predicate == ANTIGONE.lineNumber and ANTIGONE.Line in self._get_individual_types(graph, subject):
+        for subject, _, object_val in graph.triples((None, ANTIGONE.lineNumber, None)):
+            if ANTIGONE.Line in index.types_by_subject.get(subject, NO_TYPES):
                 try:
                     num = int(object_val)
                     line_numbers[num] = subject
@@ -446,22 +527,21 @@ class TripleValidator:
         for speech_uri, (start, end, contained) in speeches.items():
             for n in range(start, end + 1):
                 if n in line_numbers and n not in contained:
-                    self.errors.append(
+                    self._error(
                         f"Speech {speech_uri.n3(graph.namespace_manager)} spans lines {start}-{end} but "
                         f"does not contain :Line_{n}. Add :containsLine :Line_{n} ;"
                     )
     
-    def _check_translation_fragments(self, graph: Graph):
+    def _check_translation_fragments(self, graph: Graph, index: GraphIndex):
         """Check TranslationVariants for fragmentary or nonsensical text."""
         # Fragment patterns: text that suggests it's a continuation, not a complete translation
         # "Than" at start = fragment from "may they suffer no more than..."
         fragment_start_patterns = [
             r'^\s*Than\s+',
         ]
-        import re
         
-        for subject, predicate, object_val in graph:
-            if predicate == ANTIGONE.text and ANTIGONE.TranslationVariant in self._get_individual_types(graph, subject):
+        for subject, _, object_val in graph.triples((None, ANTIGONE.text, None)):
+            if ANTIGONE.TranslationVariant in index.types_by_subject.get(subject, NO_TYPES):
                 text = str(object_val).strip()
                 # Remove trailing line numbers for analysis
                 text_clean = re.sub(r'\s*\d+\s*$', '', text).strip()
@@ -471,7 +551,7 @@ class TripleValidator:
                         # Get related Line for context
                         related = list(graph.objects(subject, ANTIGONE.relatedTo))
                         line_ref = f" (linked to {related[0].n3(graph.namespace_manager)})" if related else ""
-                        self.errors.append(
+                        self._error(
                             f"Translation fragment: {subject.n3(graph.namespace_manager)} appears to be a "
                             f"continuation, not a complete line translation. Text starts with fragment pattern."
                             f"{line_ref} Text: \"{text_clean[:60]}...\""
@@ -483,29 +563,28 @@ class TripleValidator:
         for subject in graph.subjects(RDF.type, ANTIGONE.Line):
             refs = list(graph.objects(subject, ANTIGONE.canonicalReference))
             if not refs:
-                self.warnings.append(
+                self._warn(
                     f"Line {subject.n3(graph.namespace_manager)} is missing :canonicalReference. "
                     f"Add :canonicalReference \"N\" where N is the line number."
                 )
     
-    def _check_redundant_line_numbers(self, graph: Graph):
+    def _check_redundant_line_numbers(self, graph: Graph, index: GraphIndex):
         """Check for redundant line numbers in :text (Line and TranslationVariant)."""
-        import re
         # Line :text
-        for subject, predicate, object_val in graph:
-            if predicate == ANTIGONE.text and ANTIGONE.Line in self._get_individual_types(graph, subject):
+        for subject, _, object_val in graph.triples((None, ANTIGONE.text, None)):
+            if ANTIGONE.Line in index.types_by_subject.get(subject, NO_TYPES):
                 text = str(object_val)
                 line_nums = list(graph.objects(subject, ANTIGONE.lineNumber))
                 if line_nums:
                     n = int(line_nums[0])
                     if re.search(rf'\s+{re.escape(str(n))}\s*\.?\s*$', text):
-                        self.warnings.append(
+                        self._warn(
                             f"Redundant line number in Line :text: {subject.n3(graph.namespace_manager)} "
                             f"has \"{n}\" at end of :text; remove it (already in :lineNumber)."
                         )
         # TranslationVariant :text
-        for subject, predicate, object_val in graph:
-            if predicate == ANTIGONE.text and ANTIGONE.TranslationVariant in self._get_individual_types(graph, subject):
+        for subject, _, object_val in graph.triples((None, ANTIGONE.text, None)):
+            if ANTIGONE.TranslationVariant in index.types_by_subject.get(subject, NO_TYPES):
                 text = str(object_val)
                 # Extract line number from TV name (TV_Line_875_en -> 875)
                 local = self._get_individual_local_name(subject)
@@ -513,18 +592,18 @@ class TripleValidator:
                 if match:
                     n = match.group(1)
                     if re.search(rf'\s+{re.escape(n)}\s*\.?\s*$', text):
-                        self.warnings.append(
+                        self._warn(
                             f"Redundant line number in TranslationVariant :text: {subject.n3(graph.namespace_manager)} "
                             f"has \"{n}\" at end of :text; remove it."
                         )
     
-    def _check_scene_number_unknown(self, graph: Graph):
+    def _check_scene_number_unknown(self, graph: Graph, index: GraphIndex):
         """Check for sceneNumber 'Unknown' which may need improvement."""
-        for subject, predicate, object_val in graph:
-            if predicate == ANTIGONE.sceneNumber and ANTIGONE.Scene in self._get_individual_types(graph, subject):
+        for subject, _, object_val in graph.triples((None, ANTIGONE.sceneNumber, None)):
+            if ANTIGONE.Scene in index.types_by_subject.get(subject, NO_TYPES):
                 val = str(object_val).strip()
                 if val.lower() == 'unknown':
-                    self.warnings.append(
+                    self._warn(
                         f"Scene {subject.n3(graph.namespace_manager)} has :sceneNumber \"Unknown\". "
                         f"Consider inferring from context (e.g., Episode 4, Exodus, Exodos)."
                     )
@@ -537,57 +616,53 @@ class TripleValidator:
             triple_file: Path to the triple file to validate
             
         Returns:
-            Tuple of (is_valid, errors, warnings)
+            Tuple of (is_valid, errors, warnings); some errors are formatted lazily,
+            so convert them with str() (printing does this) rather than assuming str
         """
         self.errors = []
         self.warnings = []
+        self._error_keys = set()
+        self._warning_keys = set()
         
         if not triple_file.exists():
-            self.errors.append(f"File not found: {triple_file}")
+            self._error(f"File not found: {triple_file}")
             return False, self.errors, self.warnings
         
-        # Parse the triple file
-        graph = Graph()
+        # Parse the triple file (into the indexed in-memory store: the checks below query
+        # by subject and predicate, so a non-indexing store would be slower overall)
+        graph = Graph(store="Memory")
         try:
             graph.parse(str(triple_file), format="turtle")
         except Exception as e:
-            self.errors.append(f"Syntax error: {str(e)}")
+            self._error(f"Syntax error: {str(e)}")
             return False, self.errors, self.warnings
         
-        # Check all triples
-        for subject, predicate, object_val in graph:
-            # Skip RDF type triples for now (we check types separately)
-            if predicate == RDF.type:
-                continue
-            
-            # Check property constraints
-            if isinstance(object_val, URIRef):
-                self._check_property_constraint(graph, subject, predicate, object_val)
+        # One pass over the triples collects everything the checks below need
+        index = self._index_graph(graph)
+        types_by_subject = index.types_by_subject
         
-        # Check that all individuals are properly typed
-        individuals = set()
-        for subject, predicate, object_val in graph:
-            if predicate == RDF.type:
-                individuals.add(subject)
+        # Check property constraints, looking up only the constrained predicates in the store's
+        # predicate index instead of scanning every triple (rdf:type triples are checked separately)
+        for predicate in self.constrained_predicates:
+            for subject, _, object_val in graph.triples((None, predicate, None)):
+                if isinstance(object_val, URIRef):
+                    self._check_property_constraint(graph, subject, predicate, object_val, types_by_subject)
         
-        for individual in individuals:
-            types = self._get_individual_types(graph, individual)
+        # Check that all individuals are properly typed
+        for individual, types in types_by_subject.items():
             if not types:
-                self.warnings.append(
+                self._warn(
                     f"Individual {individual.n3(graph.namespace_manager)} has no explicit type"
                 )
-            elif ANTIGONE.Character not in types and ANTIGONE.Motivation not in types and \
-                 ANTIGONE.Emotion not in types and ANTIGONE.Theme not in types and \
-                 ANTIGONE.Conflict not in types and ANTIGONE.MoralDecision not in types and \
-                 ANTIGONE.EthicalPrinciple not in types:
+            elif types.isdisjoint(RECOGNIZED_TYPES):
                 # Check if it's at least typed as something
-                if OWL.NamedIndividual not in types and OWL.Thing not in types:
-                    self.warnings.append(
+                if types.isdisjoint(FALLBACK_TYPES):
+                    self._warn(
                         f"Individual {individual.n3(graph.namespace_manager)} may need explicit ontology type"
                     )
         
         # Check for semantic issues
-        self._check_semantic_issues(graph)
+        self._check_semantic_issues(graph, index)
         
         # Check file type: by filename (legacy) or by path (output.ttl in language subfolders)
         file_name = triple_file.name
@@ -602,43 +677,34 @@ class TripleValidator:
             # Old format (_translations.ttl): only TranslationVariants allowed
             # New format (output.ttl in english/modern_greek): structure + TV allowed, skip strict check
             if '_translations.ttl' in file_name:
-                self._check_translation_file_constraints(graph)
+                self._check_translation_file_constraints(graph, index)
         
         # Check for incomplete Greek text (only when Lines have :text - canonical/combined)
         if is_canonical or not is_translation:
-            self._check_incomplete_greek_text(graph)
+            self._check_incomplete_greek_text(graph, index)
         # Structure checks: canonical and new translation format (output.ttl in english/modern_greek)
         if is_canonical or (is_translation and file_name == 'output.ttl'):
-            self._check_speech_contains_line_coverage(graph)
+            self._check_speech_contains_line_coverage(graph, index)
             self._check_line_canonical_reference(graph)
-            self._check_scene_number_unknown(graph)
+            self._check_scene_number_unknown(graph, index)
         # Translation fragments and redundant line numbers apply to any file with Lines or TranslationVariants
-        self._check_translation_fragments(graph)
-        self._check_redundant_line_numbers(graph)
+        self._check_translation_fragments(graph, index)
+        self._check_redundant_line_numbers(graph, index)
         
         return len(self.errors) == 0, self.errors, self.warnings
     
     def _check_canonical_file_constraints(self, graph: Graph):
         """Check that canonical files don't contain TranslationVariants."""
-        for subject, predicate, object_val in graph:
-            if predicate == RDF.type and object_val == ANTIGONE.TranslationVariant:
-                self.errors.append(
-                    f"Canonical file should not contain TranslationVariants. "
-                    f"Found: {subject.n3(graph.namespace_manager)}"
-                )
+        for subject in graph.subjects(RDF.type, ANTIGONE.TranslationVariant):
+            self._error(
+                f"Canonical file should not contain TranslationVariants. "
+                f"Found: {subject.n3(graph.namespace_manager)}"
+            )
     
-    def _check_translation_file_constraints(self, graph: Graph):
+    def _check_translation_file_constraints(self, graph: Graph, index: GraphIndex):
         """Check that translation files only contain TranslationVariants."""
-        # Get all individuals and their types
-        individuals = {}
-        for subject, predicate, object_val in graph:
-            if predicate == RDF.type:
-                if subject not in individuals:
-                    individuals[subject] = set()
-                individuals[subject].add(object_val)
-        
         # Check for non-TranslationVariant individuals
-        for individual, types in individuals.items():
+        for individual, types in index.types_by_subject.items():
             if ANTIGONE.TranslationVariant not in types:
                 # Allow prefixes and basic RDF types, but not semantic content
                 allowed_types = {OWL.NamedIndividual, RDF.type}
@@ -650,17 +716,19 @@ class TripleValidator:
                         ANTIGONE.MoralDecision, ANTIGONE.EthicalPrinciple
                     }
                     if types.intersection(forbidden_types):
-                        self.errors.append(
+                        self._error(
                             f"Translation file should only contain TranslationVariants. "
                             f"Found: {individual.n3(graph.namespace_manager)} with types {[str(t) for t in types]}"
                         )
     
-    def validate_directory(self, productions_dir: str = "[PRODUCTIONS]") -> Dict[str, Tuple[bool, List[str], List[str]]]:
+    def validate_directory(self, productions_dir: str = "[PRODUCTIONS]", max_workers: Optional[int] = None) -> Dict[str, Tuple[bool, List[str], List[str]]]:
         """
         Validate all triple files in a directory.
+        Files are independent, so they are validated in parallel worker processes.
         
         Args:
             productions_dir: Path to the [PRODUCTIONS] directory
+            max_workers: Number of worker processes (default: CPU count); 1 validates in this process
             
         Returns:
             Dictionary mapping file paths to (is_valid, errors, warnings)
@@ -672,24 +740,54 @@ class TripleValidator:
             print(f"Error: Directory not found: {productions_path}")
             return results
         
-        # Find all verse range directories
-        for verse_dir in productions_path.iterdir():
-            if verse_dir.is_dir() and verse_dir.name.startswith('verse_'):
-                # New format: verse_*/{ancient_greek,english,modern_greek}/output.ttl
-                for lang in ('ancient_greek', 'english', 'modern_greek'):
-                    output_file = verse_dir / lang / 'output.ttl'
-                    if output_file.exists():
-                        is_valid, errors, warnings = self.validate_file(output_file)
-                        results[str(output_file)] = (is_valid, errors, warnings)
-                # Legacy format: verse_*/triples_*.ttl (backward compatibility)
-                for triple_file in verse_dir.glob('triples_*.ttl'):
-                    if str(triple_file) not in results:  # Avoid duplicate if both layouts exist
-                        is_valid, errors, warnings = self.validate_file(triple_file)
-                        results[str(triple_file)] = (is_valid, errors, warnings)
+        triple_files = list(_iter_triple_files(productions_path))
+        
+        max_workers = min(max_workers or os.cpu_count() or 1, len(triple_files))
+        if max_workers <= 1:
+            validated = map(self.validate_file, triple_files)
+        else:
+            # Each worker parses the ontology once (see _load_ontology) and reuses it for all its files
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                validated = list(pool.map(
+                    _validate_one, triple_files, [str(self.ontology_path)] * len(triple_files), chunksize=8
+                ))
+        for triple_file, result in zip(triple_files, validated):
+            results[str(triple_file)] = result
         
         return results
 
 
+def _iter_triple_files(productions_path: Path) -> Iterator[Path]:
+    """
+    Yield the triple files of every verse range directory: the output.ttl of each language
+    folder and legacy triples_*.ttl files. os.scandir entries know their type from the
+    directory listing, and the name filters run before any type check.
+    """
+    with os.scandir(productions_path) as entries:
+        verse_dirs = [Path(e.path) for e in entries if e.name.startswith('verse_') and e.is_dir()]
+    
+    for verse_dir in verse_dirs:
+        with os.scandir(verse_dir) as entries:
+            children = {e.name: e for e in entries}
+        # New format: verse_*/{ancient_greek,english,modern_greek}/output.ttl
+        for lang in ('ancient_greek', 'english', 'modern_greek'):
+            if lang in children and children[lang].is_dir():
+                output_file = verse_dir / lang / 'output.ttl'
+                if output_file.exists():
+                    yield output_file
+        # Legacy format: verse_*/triples_*.ttl (backward compatibility)
+        for name, entry in children.items():
+            if name.startswith('triples_') and name.endswith('.ttl') and entry.is_file():
+                yield verse_dir / name
+
+
+def _validate_one(triple_file: Path, ontology_path: str) -> Tuple[bool, List[str], List[str]]:
+    """Validate one file in a worker process of validate_directory."""
+    is_valid, errors, warnings = TripleValidator(ontology_path).validate_file(triple_file)
+    # Lazy messages hold a reference to the graph; send plain strings back to the parent
+    return is_valid, [str(e) for e in errors], [str(w) for w in warnings]
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -768,8 +866,11 @@ def main():
                 print("No triple files found to validate.")
                 sys.exit(0)
             
-            print(f"\nValidating {len(results)} triple file(s)...")
-            print("=" * 70)
+            # The report can run to thousands of lines; collect it and write it to stdout once
+            report = io.StringIO()
+            write = report.write
+            write(f"\nValidating {len(results)} triple file(s)...\n")
+            write("=" * 70 + "\n")
             
             all_valid = True
             total_warnings = 0
@@ -777,32 +878,33 @@ def main():
                 file_name = Path(file_path).name
                 if is_valid:
                     if warnings:
-                        print(f"[OK] {file_name}: VALID (but has {len(warnings)} warning(s))")
+                        write(f"[OK] {file_name}: VALID (but has {len(warnings)} warning(s))\n")
                         for warning in warnings:
-                            print(f"    WARNING: {warning}")
+                            write(f"    WARNING: {warning}\n")
                         total_warnings += len(warnings)
                     else:
-                        print(f"[OK] {file_name}: VALID")
+                        write(f"[OK] {file_name}: VALID\n")
                 else:
-                    print(f"[ERROR] {file_name}: INVALID")
+                    write(f"[ERROR] {file_name}: INVALID\n")
                     for error in errors:
-                        print(f"    ERROR: {error}")
+                        write(f"    ERROR: {error}\n")
                     all_valid = False
                     if warnings:
                         for warning in warnings:
-                            print(f"    WARNING: {warning}")
+                            write(f"    WARNING: {warning}\n")
                     total_warnings += len(warnings)
             
-            print("\n" + "=" * 70)
+            write("\n" + "=" * 70 + "\n")
             if all_valid:
                 if total_warnings > 0:
-                    print(f"[OK] All files are syntactically valid, but {total_warnings} semantic warning(s) found.")
+                    write(f"[OK] All files are syntactically valid, but {total_warnings} semantic warning(s) found.\n")
                 else:
-                    print("[OK] All files are valid!")
+                    write("[OK] All files are valid!\n")
             else:
-                print("[ERROR] Some files have constraint violations. Please fix them.")
+                write("[ERROR] Some files have constraint violations. Please fix them.\n")
                 if total_warnings > 0:
-                    print(f"Also found {total_warnings} semantic warning(s).")
+                    write(f"Also found {total_warnings} semantic warning(s).\n")
+            sys.stdout.write(report.getvalue())
             
             sys.exit(0 if all_valid else 1)
     